@@ -2,61 +2,137 @@
 
 import asyncio
 import gc
+import hashlib
+import logging
+import multiprocessing
+import os
+import pickle
 import shutil
+import time
 import uuid
-from datetime import datetime, timedelta
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from functools import lru_cache, partial
 from pathlib import Path
 from urllib.parse import urlparse
 
-import psutil
 from fastapi import FastAPI, HTTPException, BackgroundTasks
-from fastapi.responses import FileResponse, HTMLResponse
+from fastapi.responses import FileResponse, HTMLResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 # Add parent directory to path for blogpack imports
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from blogpack.crawler import discover_posts
+from blogpack.client import create_client
+from blogpack.crawler import clear_discovery_cache, discover_posts
 from blogpack.downloader import download_posts
 from blogpack.exporters import export_html, export_epub, export_pdf
 
+from jobstore import InMemoryJobStore, Job, RedisJobStore
+
+logger = logging.getLogger(__name__)
+
 # Configuration
 MAX_CONCURRENT_JOBS = 1  # Keep low for memory-constrained servers
 MAX_POSTS = 50  # Reduced for 2GB RAM servers
 TEMP_DIR = Path("/tmp/blogpack") if sys.platform != "win32" else Path("C:/temp/blogpack")
 JOB_EXPIRY_HOURS = 1
-MEMORY_THRESHOLD_PERCENT = 20  # Skip heavy exports if less than 20% memory available
+# Set to share jobs and the queue across uvicorn workers (e.g. redis://localhost:6379/0)
+REDIS_URL = os.environ.get("REDIS_URL")
+CLEANUP_INTERVAL_SECONDS = 300  # How often expired jobs and cache entries are removed
+
+# Finished zips are kept per (url, formats, max_posts) so repeat requests skip the pipeline
+RESULT_CACHE_DIR = TEMP_DIR / "cache"
+RESULT_CACHE_TTL_HOURS = 6
+RESULT_CACHE_MAX_BYTES = 5 * 1024**3  # Oldest entries are evicted beyond this
+
+# Created once here so per-job code only ever makes its own directory
+TEMP_DIR.mkdir(parents=True, exist_ok=True)
+
+# Exports run in short-lived child processes so WeasyPrint/lxml native heap
+# is returned to the OS when each export finishes
+_MP_CONTEXT = multiprocessing.get_context("spawn" if sys.platform == "win32" else "forkserver")
+_EXPORTERS = {
+    "export_html": export_html,
+    "export_epub": export_epub,
+    "export_pdf": export_pdf,
+}
+
+
+def _run_export(fn_name: str, payload_path: str, zip_path: str, **kwargs) -> Path | None:
+    """Run a single exporter in a worker process.
+
+    Loads the pickled (articles, image_map) payload written by process_blog so
+    the articles are only serialized once per job, not once per format. The
+    export is written straight into the job's zip; exports run one at a time,
+    so this child is the archive's only writer while it runs.
+    """
+    with open(payload_path, "rb") as f:
+        articles, image_map = pickle.load(f)
+    # Exports are already compressed (EPUB, PDF) or small (HTML), so store
+    # without recompressing
+    with zipfile.ZipFile(zip_path, "a", compression=zipfile.ZIP_STORED, allowZip64=True) as zf:
+        return _EXPORTERS[fn_name](articles=articles, image_map=image_map, out_zip=zf, **kwargs)
+
+
+async def run_export(fn_name: str, payload_path: Path, zip_path: Path, **kwargs) -> Path | None:
+    """Run an exporter in a fresh child process and wait for it to exit."""
+    loop = asyncio.get_running_loop()
+    with ProcessPoolExecutor(max_workers=1, mp_context=_MP_CONTEXT) as pool:
+        return await loop.run_in_executor(
+            pool, partial(_run_export, fn_name, str(payload_path), str(zip_path), **kwargs)
+        )
 
+async def _cleanup_loop():
+    """Periodically remove expired jobs, off the request path."""
+    while True:
+        await asyncio.sleep(CLEANUP_INTERVAL_SECONDS)
+        try:
+            await cleanup_old_jobs()
+        except Exception:
+            logger.exception("Periodic cleanup failed")
 
-def check_memory_available(threshold_percent: int = MEMORY_THRESHOLD_PERCENT) -> tuple[bool, float]:
-    """Check if enough memory is available.
 
-    Returns (is_ok, available_percent) where is_ok is True if available >= threshold.
-    """
-    mem = psutil.virtual_memory()
-    available_percent = mem.available / mem.total * 100
-    return available_percent >= threshold_percent, available_percent
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    cleanup_task = asyncio.create_task(_cleanup_loop())
+    yield
+    cleanup_task.cancel()
+
 
-app = FastAPI(title="Blogpack", description="Pack blogs for offline reading")
+app = FastAPI(
+    title="Blogpack",
+    description="Pack blogs for offline reading",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
 
 # Mount static assets (for noise.png, etc.)
 assets_path = Path(__file__).parent / "assets"
 if assets_path.exists():
     app.mount("/assets", StaticFiles(directory=str(assets_path)), name="assets")
 
-# In-memory job tracking
-jobs: dict[str, dict] = {}
+# Job tracking; MAX_CONCURRENT_JOBS applies across all workers sharing the store
+if REDIS_URL:
+    store = RedisJobStore(REDIS_URL, max_age_seconds=JOB_EXPIRY_HOURS * 3600)
+else:
+    store = InMemoryJobStore(max_age_seconds=JOB_EXPIRY_HOURS * 3600)
 
 
 class ProcessRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     url: str
     formats: list[str] = ["pdf", "epub", "html"]
     max_posts: int = 100
 
 
 class JobStatus(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     status: str  # "queued", "processing", "complete", "error"
     progress: str | None = None
     error: str | None = None
@@ -66,52 +142,144 @@ class JobStatus(BaseModel):
 
 
 class QueueInfo(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     processing: int  # Currently processing
     queued: int  # Waiting in queue
     total: int  # Total active jobs
     your_position: int | None = None  # Your position if you have a job
 
 
+_HTTP_PREFIXES = ("http://", "https://")
+_DOMAIN_PREFIXES = ("www.", "blog.", "blogs.")
+
+
+@lru_cache(maxsize=1024)
 def normalize_url(url: str) -> str:
     """Normalize blog URL."""
     url = url.strip()
-    if not url.startswith(("http://", "https://")):
+    if not url.startswith(_HTTP_PREFIXES):
         url = "https://" + url
     if not url.endswith("/"):
         url = url + "/"
     return url
 
 
+@lru_cache(maxsize=1024)
 def get_blog_title_from_url(url: str) -> str:
     """Extract a readable title from URL."""
-    parsed = urlparse(url)
-    domain = parsed.netloc
+    domain = urlparse(url).netloc
     # Remove common prefixes
-    for prefix in ["www.", "blog.", "blogs."]:
-        if domain.startswith(prefix):
-            domain = domain[len(prefix):]
+    for prefix in _DOMAIN_PREFIXES:
+        domain = domain.removeprefix(prefix)
     return domain.replace(".", " ").title()
 
 
+def _move_into_zip(zip_path: Path, path: Path, root: Path):
+    """Append a directory tree to the zip, then delete it from disk.
+
+    Blocking; run it with asyncio.to_thread.
+    """
+    with zipfile.ZipFile(zip_path, "a", compression=zipfile.ZIP_STORED, allowZip64=True) as zf:
+        for file in sorted(path.rglob("*")):
+            if file.is_file():
+                zf.write(file, arcname=file.relative_to(root))
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def _result_cache_key(url: str, formats: list[str], max_posts: int) -> str:
+    """Key for a finished download; url must already be normalized."""
+    raw = f"{url}|{','.join(sorted(set(formats)))}|{max_posts}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _link_or_copy(src: Path, dst: Path):
+    """Hard-link src to dst (same filesystem), copying if linking isn't possible."""
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def get_cached_result(key: str) -> Path | None:
+    """Return the cached zip for key if it exists and hasn't expired.
+
+    Blocking; run it with asyncio.to_thread.
+    """
+    zip_path = RESULT_CACHE_DIR / key / "download.zip"
+    try:
+        mtime = zip_path.stat().st_mtime
+    except FileNotFoundError:
+        return None
+    if time.time() - mtime > RESULT_CACHE_TTL_HOURS * 3600:
+        return None
+    return zip_path
+
+
+def _serve_cached_result(cached_zip: Path, job_dir: Path):
+    """Give a new job a cached zip as its download. Blocking; run it with asyncio.to_thread."""
+    job_dir.mkdir(exist_ok=True)
+    _link_or_copy(cached_zip, job_dir / "download.zip")
+
+
+def store_cached_result(key: str, zip_path: Path):
+    """Keep a finished job's zip in the result cache, then enforce the size cap."""
+    entry_dir = RESULT_CACHE_DIR / key
+    entry_dir.mkdir(parents=True, exist_ok=True)
+    _link_or_copy(zip_path, entry_dir / "download.zip")
+    prune_result_cache()
+
+
+def prune_result_cache():
+    """Drop expired cache entries, then the oldest ones until under RESULT_CACHE_MAX_BYTES."""
+    if not RESULT_CACHE_DIR.exists():
+        return
+    cutoff = time.time() - RESULT_CACHE_TTL_HOURS * 3600
+    entries = []
+    for entry_dir in RESULT_CACHE_DIR.iterdir():
+        try:
+            stat = (entry_dir / "download.zip").stat()
+        except OSError:
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            continue
+        if stat.st_mtime < cutoff:
+            shutil.rmtree(entry_dir, ignore_errors=True)
+        else:
+            entries.append((stat.st_mtime, stat.st_size, entry_dir))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, entry_dir in sorted(entries):
+        if total <= RESULT_CACHE_MAX_BYTES:
+            break
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        total -= size
+
+
 async def process_blog(job_id: str, url: str, formats: list[str], max_posts: int):
     """Background task to process a blog."""
     output_dir = TEMP_DIR / job_id
-    output_dir.mkdir(parents=True, exist_ok=True)
+    output_dir.mkdir(exist_ok=True)
+    zip_path = output_dir / "download.zip"
 
     try:
-        jobs[job_id]["progress"] = "Discovering posts..."
+        await store.update(job_id, progress="Discovering posts...")
 
-        # Discover posts
-        platform, posts = await discover_posts(url)
+        # One client (and connection pool) for discovery and download
+        async with create_client() as client:
+            # Discover posts
+            platform, posts = await discover_posts(url, client=client)
 
-        # Limit posts
-        posts = posts[:min(max_posts, MAX_POSTS)]
-        jobs[job_id]["progress"] = f"Downloading {len(posts)} posts..."
+            # Limit posts
+            posts = posts[:min(max_posts, MAX_POSTS)]
+            await store.update(job_id, progress=f"Downloading {len(posts)} posts...")
 
-        # Download posts
-        articles, image_map = await download_posts(
-            url, posts, platform, include_images=True, output_dir=output_dir
-        )
+            # Download posts
+            articles, image_map = await download_posts(
+                url, posts, platform, include_images=True, output_dir=output_dir, client=client,
+                # One extra process keeps parsing off the event loop within the memory budget
+                extract_workers=1,
+            )
 
         if not articles:
             raise ValueError("No articles could be downloaded")
@@ -120,148 +288,115 @@ async def process_blog(job_id: str, url: str, formats: list[str], max_posts: int
         blog_title = get_blog_title_from_url(url)
         blog_author = articles[0].author if articles else "Unknown"
 
-        # Export to requested formats
+        # Serialize once; each export child loads it from disk
+        payload_path = output_dir / "articles.pickle"
+        with open(payload_path, "wb") as f:
+            pickle.dump((articles, image_map), f, protocol=pickle.HIGHEST_PROTOCOL)
+        del articles, image_map
+
+        # Export to requested formats, each written directly into the zip
         exported_files = []
-        skipped_formats = []
 
-        # HTML is lightweight, always attempt it
         if "html" in formats:
-            jobs[job_id]["progress"] = "Generating HTML..."
-            html_path = export_html(articles, output_dir, url, image_map, blog_title)
+            await store.update(job_id, progress="Generating HTML...")
+            html_path = await run_export(
+                "export_html", payload_path, zip_path,
+                output_dir=output_dir, base_url=url, blog_title=blog_title,
+            )
             exported_files.append(html_path)
-            gc.collect()  # Clean up after each export
 
-        # EPUB - medium memory usage, check before starting
         if "epub" in formats:
-            mem_ok, mem_avail = check_memory_available()
-            if mem_ok:
-                jobs[job_id]["progress"] = "Generating EPUB..."
-                epub_path = export_epub(articles, output_dir, url, image_map, blog_title, blog_author)
-                if epub_path:
-                    exported_files.append(epub_path)
-                gc.collect()
-            else:
-                skipped_formats.append("EPUB")
-                jobs[job_id]["progress"] = f"Skipping EPUB (low memory: {mem_avail:.0f}% free)..."
-
-        # PDF - heaviest memory usage, check before starting
+            await store.update(job_id, progress="Generating EPUB...")
+            epub_path = await run_export(
+                "export_epub", payload_path, zip_path,
+                output_dir=output_dir, base_url=url, blog_title=blog_title, blog_author=blog_author,
+            )
+            if epub_path:
+                exported_files.append(epub_path)
+
         if "pdf" in formats:
-            mem_ok, mem_avail = check_memory_available()
-            if mem_ok:
-                jobs[job_id]["progress"] = "Generating PDF..."
-                pdf_path = export_pdf(articles, output_dir, url, image_map, blog_title, blog_author)
-                if pdf_path:
-                    exported_files.append(pdf_path)
-                gc.collect()
-            else:
-                skipped_formats.append("PDF")
-                jobs[job_id]["progress"] = f"Skipping PDF (low memory: {mem_avail:.0f}% free)..."
+            await store.update(job_id, progress="Generating PDF...")
+            pdf_path = await run_export(
+                "export_pdf", payload_path, zip_path,
+                output_dir=output_dir, base_url=url, blog_title=blog_title, blog_author=blog_author,
+            )
+            if pdf_path:
+                exported_files.append(pdf_path)
+
+        payload_path.unlink()
 
         # Check if we have any exported files
         if not exported_files:
-            raise ValueError("No formats could be exported - server memory too low. Try fewer posts.")
+            raise ValueError("No formats could be exported. Try fewer posts.")
 
-        # Create zip file
-        jobs[job_id]["progress"] = "Creating download package..."
-        zip_path = output_dir / "download"
-        shutil.make_archive(str(zip_path), "zip", output_dir)
+        # Images were needed by every export, so they go in last
+        await store.update(job_id, progress="Creating download package...")
+        images_dir = output_dir / "images"
+        if images_dir.exists():
+            await asyncio.to_thread(_move_into_zip, zip_path, images_dir, output_dir)
 
-        jobs[job_id]["status"] = "complete"
-        jobs[job_id]["download_ready"] = True
+        await asyncio.to_thread(
+            store_cached_result, _result_cache_key(url, formats, max_posts), zip_path
+        )
 
-        # Set completion message with skipped format info
-        if skipped_formats:
-            jobs[job_id]["progress"] = f"Done! (Skipped {', '.join(skipped_formats)} due to low memory - try fewer posts)"
-        else:
-            jobs[job_id]["progress"] = None
+        await store.update(job_id, status="complete", download_ready=True, progress=None)
 
     except Exception as e:
-        jobs[job_id]["status"] = "error"
-        jobs[job_id]["error"] = str(e)
-        jobs[job_id]["progress"] = None
+        await store.update(job_id, status="error", error=str(e), progress=None)
     finally:
-        # Force garbage collection to free memory from WeasyPrint/BeautifulSoup
+        await store.finish(job_id)
+        # Force garbage collection to free memory from the download phase
         gc.collect()
         # Process next queued job if any
         await process_next_queued_job()
 
 
-def cleanup_old_jobs():
-    """Remove jobs older than JOB_EXPIRY_HOURS."""
-    cutoff = datetime.now() - timedelta(hours=JOB_EXPIRY_HOURS)
-    to_remove = []
-    for job_id, job in jobs.items():
-        if job.get("created_at", datetime.now()) < cutoff:
-            to_remove.append(job_id)
-            # Clean up files
-            job_dir = TEMP_DIR / job_id
-            if job_dir.exists():
-                shutil.rmtree(job_dir, ignore_errors=True)
-
-    for job_id in to_remove:
-        del jobs[job_id]
-
-
-def get_queue_stats() -> tuple[int, int, list[str]]:
-    """Get queue statistics. Returns (processing_count, queued_count, queued_job_ids_in_order)."""
-    processing = 0
-    queued_jobs = []
+def _remove_job_dirs(expired: set[str], cutoff_ts: float):
+    """Delete expired jobs' directories, plus any others older than cutoff_ts.
 
-    for job_id, job in jobs.items():
-        if job["status"] == "processing":
-            processing += 1
-        elif job["status"] == "queued":
-            queued_jobs.append((job_id, job.get("queued_at", job.get("created_at"))))
+    A job directory is never older than its job, so anything past the cutoff
+    belongs to a job that has expired (including ones a restart forgot, or
+    that expired out of Redis). Blocking; run it with asyncio.to_thread.
+    """
+    with os.scandir(TEMP_DIR) as it:
+        for entry in it:
+            if entry.name == RESULT_CACHE_DIR.name or not entry.is_dir(follow_symlinks=False):
+                continue
+            if entry.name in expired or entry.stat(follow_symlinks=False).st_mtime < cutoff_ts:
+                shutil.rmtree(entry.path, ignore_errors=True)
 
-    # Sort queued jobs by queue time (oldest first)
-    queued_jobs.sort(key=lambda x: x[1])
-    queued_ids = [j[0] for j in queued_jobs]
 
-    return processing, len(queued_ids), queued_ids
+async def cleanup_old_jobs():
+    """Remove jobs older than JOB_EXPIRY_HOURS."""
+    to_remove = await store.remove_expired()
 
+    # Drop expired discovery results and zips so the caches don't grow unbounded
+    clear_discovery_cache(expired_only=True)
 
-def get_queue_position(job_id: str) -> int | None:
-    """Get position in queue for a job (1 = next up). Returns None if not queued."""
-    if job_id not in jobs or jobs[job_id]["status"] != "queued":
-        return None
+    # File removal is O(files), so keep it off the event loop
+    cutoff_ts = time.time() - JOB_EXPIRY_HOURS * 3600
+    await asyncio.to_thread(_remove_job_dirs, set(to_remove), cutoff_ts)
+    await asyncio.to_thread(prune_result_cache)
 
-    _, _, queued_ids = get_queue_stats()
-    try:
-        return queued_ids.index(job_id) + 1
-    except ValueError:
-        return None
+    # Expired claims may have freed capacity
+    await process_next_queued_job()
 
 
 async def process_next_queued_job():
     """Start processing the next job in queue if capacity available."""
-    processing, _, queued_ids = get_queue_stats()
-
-    if processing >= MAX_CONCURRENT_JOBS or not queued_ids:
+    job_id = await store.claim_next(MAX_CONCURRENT_JOBS)
+    if job_id is None:
         return
 
-    # Get the next job to process
-    next_job_id = queued_ids[0]
-    job = jobs[next_job_id]
-
-    # Update status and start processing
-    job["status"] = "processing"
-    job["progress"] = "Starting..."
+    job = await store.get(job_id)
 
     # Start the background task
-    asyncio.create_task(process_blog(
-        next_job_id,
-        job["url"],
-        job["formats"],
-        job["max_posts"]
-    ))
+    asyncio.create_task(process_blog(job_id, job.url, job.formats, job.max_posts))
 
 
 @app.post("/process")
-async def start_processing(request: ProcessRequest, background_tasks: BackgroundTasks):
+async def start_processing(request: ProcessRequest):
     """Start processing a blog URL."""
-    # Clean up old jobs first
-    cleanup_old_jobs()
-
     # Validate request
     if not request.url:
         raise HTTPException(status_code=400, detail="URL is required")
@@ -273,66 +408,53 @@ async def start_processing(request: ProcessRequest, background_tasks: Background
     url = normalize_url(request.url)
     max_posts = min(max(1, request.max_posts), MAX_POSTS)
 
-    # Check if we can start immediately or need to queue
-    processing, queued, _ = get_queue_stats()
-    now = datetime.now()
-
     job_id = str(uuid.uuid4())
+    job = Job(status="queued", url=url, formats=list(request.formats), max_posts=max_posts)
 
-    if processing < MAX_CONCURRENT_JOBS:
-        # Can start immediately
-        jobs[job_id] = {
-            "status": "processing",
-            "progress": "Starting...",
-            "error": None,
-            "download_ready": False,
-            "created_at": now,
-            "url": url,
-            "formats": request.formats,
-            "max_posts": max_posts,
-        }
-        # Start background processing
-        background_tasks.add_task(process_blog, job_id, url, request.formats, max_posts)
+    cached_zip = await asyncio.to_thread(
+        get_cached_result, _result_cache_key(url, request.formats, max_posts)
+    )
+    if cached_zip is not None:
+        # Same request finished recently; hand out the existing zip (a copy
+        # can be slow across filesystems, so it stays off the event loop)
+        await asyncio.to_thread(_serve_cached_result, cached_zip, TEMP_DIR / job_id)
+        job.status = "complete"
+        job.download_ready = True
+        await store.add(job_id, job)
     else:
-        # Add to queue
-        jobs[job_id] = {
-            "status": "queued",
-            "progress": None,
-            "error": None,
-            "download_ready": False,
-            "created_at": now,
-            "queued_at": now,
-            "url": url,
-            "formats": request.formats,
-            "max_posts": max_posts,
-        }
+        # Queue it, then start it right away if there is capacity
+        await store.add(job_id, job)
+        await process_next_queued_job()
 
     return {"job_id": job_id}
 
 
-@app.get("/status/{job_id}")
-async def get_status(job_id: str) -> JobStatus:
+@app.get("/status/{job_id}", response_model=JobStatus)
+async def get_status(job_id: str) -> ORJSONResponse:
     """Get the status of a processing job."""
-    if job_id not in jobs:
+    job = await store.get(job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    job = jobs[job_id]
-    processing, queued, _ = get_queue_stats()
+    processing, queued = await store.queue_stats()
+    queue_position = await store.queue_position(job_id) if job.status == "queued" else None
 
-    return JobStatus(
-        status=job["status"],
-        progress=job.get("progress"),
-        error=job.get("error"),
-        download_ready=job.get("download_ready", False),
-        queue_position=get_queue_position(job_id),
-        queue_total=processing + queued,
-    )
+    # Polled every second by each client, so skip building and validating a
+    # JobStatus; the fields are already the right types
+    return ORJSONResponse({
+        "status": job.status,
+        "progress": job.progress,
+        "error": job.error,
+        "download_ready": job.download_ready,
+        "queue_position": queue_position,
+        "queue_total": processing + queued,
+    })
 
 
 @app.get("/queue")
 async def get_queue() -> QueueInfo:
     """Get current queue status for display."""
-    processing, queued, _ = get_queue_stats()
+    processing, queued = await store.queue_stats()
     return QueueInfo(
         processing=processing,
         queued=queued,
@@ -343,11 +465,11 @@ async def get_queue() -> QueueInfo:
 @app.get("/download/{job_id}")
 async def download_file(job_id: str, background_tasks: BackgroundTasks):
     """Download the generated zip file."""
-    if job_id not in jobs:
+    job = await store.get(job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    job = jobs[job_id]
-    if job["status"] != "complete":
+    if job.status != "complete":
         raise HTTPException(status_code=400, detail="Job not complete")
 
     zip_path = TEMP_DIR / job_id / "download.zip"
@@ -355,12 +477,9 @@ async def download_file(job_id: str, background_tasks: BackgroundTasks):
         raise HTTPException(status_code=404, detail="Download file not found")
 
     # Schedule cleanup after download
-    def cleanup():
-        job_dir = TEMP_DIR / job_id
-        if job_dir.exists():
-            shutil.rmtree(job_dir, ignore_errors=True)
-        if job_id in jobs:
-            del jobs[job_id]
+    async def cleanup():
+        await store.delete(job_id)
+        await asyncio.to_thread(shutil.rmtree, TEMP_DIR / job_id, True)
 
     background_tasks.add_task(cleanup)
 
@@ -371,14 +490,25 @@ async def download_file(job_id: str, background_tasks: BackgroundTasks):
     )
 
 
-# Serve the frontend
+# Serve the frontend (read once; the page is static)
+_INDEX_HTML = (Path(__file__).parent / "static" / "index.html").read_text()
+
+
 @app.get("/", response_class=HTMLResponse)
 async def serve_frontend():
     """Serve the main page."""
-    static_path = Path(__file__).parent / "static" / "index.html"
-    return HTMLResponse(content=static_path.read_text())
+    return HTMLResponse(content=_INDEX_HTML)
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # C event loop and HTTP parser (uvicorn[standard]); uvloop has no Windows build
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8000,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=1,
+        limit_concurrency=64,
+    )
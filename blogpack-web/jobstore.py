@@ -0,0 +1,215 @@
+"""Job state and queue storage for the web app.
+
+InMemoryJobStore keeps everything in the server process, so it only works
+with a single uvicorn worker. RedisJobStore keeps the same state in Redis so
+several workers (or restarted ones) share one view of jobs and the queue.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+
+import orjson
+
+
+@dataclass(slots=True)
+class Job:
+    """One export job; slotted since many can sit in memory until they expire."""
+    status: str  # "queued", "processing", "complete", "error"
+    url: str
+    formats: list[str]
+    max_posts: int
+    progress: str | None = None
+    error: str | None = None
+    download_ready: bool = False
+    created_mono: float = 0.0  # time.monotonic(), set by the in-memory store
+
+
+class InMemoryJobStore:
+    """Jobs in a dict, with a FIFO queue index so polling never scans jobs."""
+
+    def __init__(self, max_age_seconds: float):
+        self._max_age = max_age_seconds
+        self._jobs: dict[str, Job] = {}
+        self._queued: "OrderedDict[str, None]" = OrderedDict()  # Oldest first
+        self._processing: set[str] = set()
+
+    async def add(self, job_id: str, job: Job):
+        """Store a new job; jobs with status "queued" join the back of the queue."""
+        job.created_mono = time.monotonic()
+        self._jobs[job_id] = job
+        if job.status == "queued":
+            self._queued[job_id] = None
+
+    async def get(self, job_id: str) -> Job | None:
+        """Return the job (treat as read-only; use update to change it)."""
+        return self._jobs.get(job_id)
+
+    async def update(self, job_id: str, **fields):
+        job = self._jobs.get(job_id)
+        if job is not None:
+            for name, value in fields.items():
+                setattr(job, name, value)
+
+    async def delete(self, job_id: str):
+        self._jobs.pop(job_id, None)
+        self._queued.pop(job_id, None)
+        self._processing.discard(job_id)
+
+    async def claim_next(self, max_processing: int) -> str | None:
+        """Move the oldest queued job to processing if there is capacity."""
+        if len(self._processing) >= max_processing or not self._queued:
+            return None
+        job_id, _ = self._queued.popitem(last=False)
+        self._processing.add(job_id)
+        job = self._jobs[job_id]
+        job.status = "processing"
+        job.progress = "Starting..."
+        return job_id
+
+    async def finish(self, job_id: str):
+        """Release the processing slot held by job_id."""
+        self._processing.discard(job_id)
+
+    async def queue_stats(self) -> tuple[int, int]:
+        """Returns (processing_count, queued_count)."""
+        return len(self._processing), len(self._queued)
+
+    async def queue_position(self, job_id: str) -> int | None:
+        """Position in queue (1 = next up), or None if not queued."""
+        if job_id not in self._queued:
+            return None
+        for position, queued_id in enumerate(self._queued, start=1):
+            if queued_id == job_id:
+                return position
+        return None
+
+    async def remove_expired(self) -> list[str]:
+        """Delete jobs older than max_age_seconds and return their ids."""
+        cutoff = time.monotonic() - self._max_age
+        expired = [job_id for job_id, job in self._jobs.items() if job.created_mono < cutoff]
+        for job_id in expired:
+            await self.delete(job_id)
+        return expired
+
+
+# Pops queued ids until one whose job still exists, and claims it only if the
+# processing set has room; atomic across workers
+_CLAIM_SCRIPT = """
+if redis.call('ZCARD', KEYS[2]) >= tonumber(ARGV[1]) then
+    return false
+end
+while true do
+    local job_id = redis.call('LPOP', KEYS[1])
+    if not job_id then
+        return false
+    end
+    local key = ARGV[3] .. job_id
+    if redis.call('EXISTS', key) == 1 then
+        redis.call('ZADD', KEYS[2], ARGV[2], job_id)
+        redis.call('HSET', key, 'status', '"processing"', 'progress', '"Starting..."')
+        return job_id
+    end
+end
+"""
+
+# Sets fields (ARGV holds name, value pairs) only on a job that still exists,
+# so a late update can't resurrect an expired job as a hash with no TTL
+_UPDATE_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    redis.call('HSET', KEYS[1], unpack(ARGV))
+end
+"""
+
+
+class RedisJobStore:
+    """Jobs as Redis hashes (one JSON-encoded field per Job attribute) that
+    expire after max_age_seconds.
+
+    The queue is a list of job ids and processing jobs are a sorted set scored
+    by claim time, so claims left by a crashed worker can be dropped once they
+    are older than max_age_seconds.
+    """
+
+    JOB_PREFIX = "blogpack:job:"
+    QUEUE_KEY = "blogpack:queue"
+    PROCESSING_KEY = "blogpack:processing"
+
+    def __init__(self, url: str, max_age_seconds: float):
+        import redis.asyncio as redis
+
+        self._max_age = int(max_age_seconds)
+        self._redis = redis.from_url(url, decode_responses=True)
+        self._claim = self._redis.register_script(_CLAIM_SCRIPT)
+        self._update = self._redis.register_script(_UPDATE_SCRIPT)
+
+    def _key(self, job_id: str) -> str:
+        return self.JOB_PREFIX + job_id
+
+    async def add(self, job_id: str, job: Job):
+        """Store a new job; jobs with status "queued" join the back of the queue."""
+        key = self._key(job_id)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping={k: orjson.dumps(v) for k, v in asdict(job).items()})
+            pipe.expire(key, self._max_age)
+            if job.status == "queued":
+                pipe.rpush(self.QUEUE_KEY, job_id)
+            await pipe.execute()
+
+    async def get(self, job_id: str) -> Job | None:
+        raw = await self._redis.hgetall(self._key(job_id))
+        if not raw:
+            return None
+        return Job(**{k: orjson.loads(v) for k, v in raw.items()})
+
+    async def update(self, job_id: str, **fields):
+        if not fields:
+            return
+        args = [item for name, value in fields.items() for item in (name, orjson.dumps(value))]
+        await self._update(keys=[self._key(job_id)], args=args)
+
+    async def delete(self, job_id: str):
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.delete(self._key(job_id))
+            pipe.lrem(self.QUEUE_KEY, 0, job_id)
+            pipe.zrem(self.PROCESSING_KEY, job_id)
+            await pipe.execute()
+
+    async def claim_next(self, max_processing: int) -> str | None:
+        """Move the oldest queued job to processing if there is capacity."""
+        job_id = await self._claim(
+            keys=[self.QUEUE_KEY, self.PROCESSING_KEY],
+            args=[max_processing, time.time(), self.JOB_PREFIX],
+        )
+        return job_id or None
+
+    async def finish(self, job_id: str):
+        """Release the processing slot held by job_id."""
+        await self._redis.zrem(self.PROCESSING_KEY, job_id)
+
+    async def queue_stats(self) -> tuple[int, int]:
+        """Returns (processing_count, queued_count)."""
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.zcard(self.PROCESSING_KEY)
+            pipe.llen(self.QUEUE_KEY)
+            processing, queued = await pipe.execute()
+        return processing, queued
+
+    async def queue_position(self, job_id: str) -> int | None:
+        """Position in queue (1 = next up), or None if not queued."""
+        index = await self._redis.lpos(self.QUEUE_KEY, job_id)
+        return None if index is None else index + 1
+
+    async def remove_expired(self) -> list[str]:
+        """Drop stale processing claims and queue entries of expired jobs.
+
+        Job hashes expire on their own; returns the ids of stale claims.
+        """
+        cutoff = time.time() - self._max_age
+        stale = await self._redis.zrangebyscore(self.PROCESSING_KEY, "-inf", cutoff)
+        if stale:
+            await self._redis.zrem(self.PROCESSING_KEY, *stale)
+        for job_id in await self._redis.lrange(self.QUEUE_KEY, 0, -1):
+            if not await self._redis.exists(self._key(job_id)):
+                await self._redis.lrem(self.QUEUE_KEY, 0, job_id)
+        return stale
@@ -1,3 +1,3 @@
 """blogpack - Download entire blogs for offline reading."""
 
-__version__ = "0.1.0"
+__version__ = "0.1.4"  # Keep in sync with pyproject.toml
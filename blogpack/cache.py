@@ -0,0 +1,20 @@
+"""JSON files that let re-runs into the same folder skip finished work."""
+
+import json
+import os
+from pathlib import Path
+
+
+def load_json_cache(cache_path: Path) -> dict[str, dict]:
+    """Read a cache or manifest, treating a missing or corrupt file as empty."""
+    try:
+        return json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def save_json_cache(cache_path: Path, cache: dict[str, dict]):
+    """Write a cache or manifest atomically so an interrupted run can't corrupt it."""
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    tmp_path.write_text(json.dumps(cache), encoding="utf-8")
+    os.replace(tmp_path, cache_path)
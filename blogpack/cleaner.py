@@ -1,7 +1,11 @@
 """Clean and normalize article HTML content."""
 
 import re
-from bs4 import BeautifulSoup
+
+from lxml import etree
+from lxml import html as lxml_html
+
+from .platforms.base import _html_parser
 
 # Minimal CSS for pleasant reading
 READER_CSS = """
@@ -76,6 +80,21 @@ hr {
 }
 """
 
+# Inlined into every article page, so collapse the whitespace once here
+_READER_CSS_MIN = re.sub(r"\s+", " ", READER_CSS).strip()
+_STYLE_TAG = f"<style>{_READER_CSS_MIN}</style>"
+
+# Ghost CMS kg-card comments (they get mangled by parser)
+_KG_COMMENT_RE = re.compile(r'<!--kg-card-(?:begin|end): \w+-->')
+# Also matches if they've already been mangled into text
+_KG_TEXT_RE = re.compile(r'kg-card-(?:begin|end): \w+')
+
+_UNWANTED_TAGS = ("script", "style", "iframe", "noscript", "button")
+# Tracking handlers and styling that might break offline reading
+_UNWANTED_ATTRS = ("onclick", "onload", "style", "class", "id")
+# Interactive UI elements (expand buttons, refresh buttons, .captioned-button-wrap, etc.)
+_BUTTON_XPATH = etree.XPath("//*[contains(@class, 'button') or contains(@class, 'Button')]")
+
 
 def clean_html(content_html: str) -> str:
     """
@@ -83,35 +102,31 @@ def clean_html(content_html: str) -> str:
 
     Removes scripts, styles, unwanted attributes, and wrapper tags.
     """
-    # Remove Ghost CMS kg-card comments (they get mangled by parser)
-    content_html = re.sub(r'<!--kg-card-(?:begin|end): \w+-->', '', content_html)
-    # Also remove if they've already been mangled into text
-    content_html = re.sub(r'kg-card-(?:begin|end): \w+', '', content_html)
-
-    soup = BeautifulSoup(content_html, "lxml")
-
-    # Remove unwanted elements
-    for tag in soup.find_all(["script", "style", "iframe", "noscript", "button"]):
-        tag.decompose()
-
-    # Remove interactive UI elements (expand buttons, refresh buttons, etc.)
-    for tag in soup.select("[class*='button'], [class*='Button'], .captioned-button-wrap"):
-        tag.decompose()
-
-    # Remove unwanted attributes (tracking, styles that might break)
-    attrs_to_remove = ["onclick", "onload", "style", "class", "id"]
-    for tag in soup.find_all(True):
-        for attr in attrs_to_remove:
-            if attr in tag.attrs:
-                del tag.attrs[attr]
-
-    # Extract just the body content, not the html/body wrapper
-    body = soup.find("body")
-    if body:
-        # Get inner HTML of body
-        return "".join(str(child) for child in body.children)
-
-    return str(soup)
+    content_html = _KG_COMMENT_RE.sub('', content_html)
+    content_html = _KG_TEXT_RE.sub('', content_html)
+    if not content_html.strip():
+        return ""
+
+    try:
+        tree = lxml_html.document_fromstring(content_html, parser=_html_parser())
+    except etree.ParserError:
+        # Nothing but comments or whitespace entities: no elements to keep
+        return ""
+
+    # Element and attribute stripping run in libxml2, not per-tag Python loops
+    etree.strip_elements(tree, *_UNWANTED_TAGS, with_tail=False)
+    for tag in _BUTTON_XPATH(tree):
+        tag.drop_tree()
+    etree.strip_attributes(tree, *_UNWANTED_ATTRS)
+
+    # Extract just the body content, not the html/body wrapper. Serialize the
+    # body in one call and slice off its (attribute-free) tags
+    body = tree.find("body")
+    if body is None:
+        return lxml_html.tostring(tree, encoding="unicode", method="html")
+    body.attrib.clear()
+    serialized = lxml_html.tostring(body, encoding="unicode", method="html", with_tail=False)
+    return serialized[len("<body>"):-len("</body>")]
 
 
 def wrap_article_html(
@@ -134,7 +149,7 @@ def wrap_article_html(
     Returns:
         Complete HTML document string
     """
-    css = f"<style>{READER_CSS}</style>" if include_css else ""
+    css = _STYLE_TAG if include_css else ""
 
     return f"""<!DOCTYPE html>
 <html lang="en">
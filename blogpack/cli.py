@@ -1,15 +1,18 @@
 """CLI entry point for blogpack."""
 
 import asyncio
+import re
+from collections import Counter
 from pathlib import Path
 from urllib.parse import urlparse
 
 import typer
 from rich.console import Console
 
+from .client import create_client
 from .crawler import discover_posts
-from .downloader import download_posts
-from .exporters import export_html, export_epub, export_pdf
+from .downloader import POST_CACHE_DIRNAME, download_posts
+from .exporters import export_html, export_epub, export_pdf, clear_content_cache
 
 app = typer.Typer(
     name="blogpack",
@@ -18,6 +21,9 @@ app = typer.Typer(
 )
 console = Console()
 
+# Host parts dropped from the blog title
+_TITLE_NOISE_RE = re.compile(r"www\.|\.com|\.org")
+
 
 @app.command()
 def main(
@@ -52,6 +58,12 @@ def main(
         "--verify-ssl/--no-verify-ssl",
         help="Verify SSL certificates (disable for sites with cert issues)",
     ),
+    rps: float = typer.Option(
+        None,
+        "--rps",
+        min=0.01,
+        help="Max post requests per second per host (defaults to a per-platform limit)",
+    ),
 ):
     """
     Download a blog for offline reading.
@@ -59,7 +71,7 @@ def main(
     Example:
         blogpack https://www.cold-takes.com/ -o ./cold-takes
     """
-    asyncio.run(_run(url, output, format, images, platform, limit, verify_ssl))
+    asyncio.run(_run(url, output, format, images, platform, limit, verify_ssl, rps))
 
 
 async def _run(
@@ -70,6 +82,7 @@ async def _run(
     platform: str | None,
     limit: int | None,
     verify_ssl: bool,
+    rps: float | None = None,
 ):
     """Async main function."""
     # Normalize URL
@@ -91,31 +104,38 @@ async def _run(
 
     console.print(f"\n[bold]blogpack[/bold] - Downloading {url}\n")
 
-    # Discover posts
-    try:
-        detected_platform, posts = await discover_posts(url, platform=None, verify_ssl=verify_ssl)
-    except Exception as e:
-        console.print(f"[red]Error discovering posts: {e}[/red]")
-        raise typer.Exit(1)
-
-    if not posts:
-        console.print("[yellow]No posts found.[/yellow]")
-        raise typer.Exit(0)
-
-    # Apply limit if specified
-    if limit and limit > 0:
-        posts = posts[:limit]
-        console.print(f"[cyan]Limiting to {limit} posts for download[/cyan]")
-
-    # Download posts and images
-    articles, image_map = await download_posts(
-        base_url=url,
-        posts=posts,
-        platform=detected_platform,
-        include_images=images,
-        output_dir=output / "html" if images else None,
-        verify_ssl=verify_ssl,
-    )
+    # One client (and connection pool) for discovery and download
+    async with create_client(verify_ssl) as client:
+        # Discover posts
+        try:
+            detected_platform, posts = await discover_posts(
+                url, platform=None, verify_ssl=verify_ssl, client=client
+            )
+        except Exception as e:
+            console.print(f"[red]Error discovering posts: {e}[/red]")
+            raise typer.Exit(1)
+
+        if not posts:
+            console.print("[yellow]No posts found.[/yellow]")
+            raise typer.Exit(0)
+
+        # Apply limit if specified
+        if limit and limit > 0:
+            posts = posts[:limit]
+            console.print(f"[cyan]Limiting to {limit} posts for download[/cyan]")
+
+        # Download posts and images
+        articles, image_map = await download_posts(
+            base_url=url,
+            posts=posts,
+            platform=detected_platform,
+            include_images=images,
+            output_dir=output / "html" if images else None,
+            verify_ssl=verify_ssl,
+            client=client,
+            rps=rps,
+            post_cache_dir=output / POST_CACHE_DIRNAME,
+        )
 
     if not articles:
         console.print("[yellow]No articles could be downloaded.[/yellow]")
@@ -125,12 +145,12 @@ async def _run(
 
     # Determine blog title and author from first article
     parsed_url = urlparse(url)
-    blog_title = parsed_url.netloc.replace("www.", "").replace(".com", "").replace(".org", "").title()
+    blog_title = _TITLE_NOISE_RE.sub("", parsed_url.netloc).title()
     blog_title = f"{blog_title} Archive"
 
     # Use most common author
-    authors = [a.author for a in articles if a.author != "Unknown"]
-    blog_author = max(set(authors), key=authors.count) if authors else "Unknown"
+    author_counts = Counter(a.author for a in articles if a.author != "Unknown")
+    blog_author = author_counts.most_common(1)[0][0] if author_counts else "Unknown"
 
     # Parse formats
     formats = set()
@@ -168,6 +188,7 @@ async def _run(
             blog_title=blog_title,
             blog_author=blog_author,
         )
+    clear_content_cache()
 
     console.print(f"\n[bold green]Done![/bold green] Output saved to {output.absolute()}\n")
 
@@ -0,0 +1,50 @@
+"""Shared HTTP client for crawling and downloading."""
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import httpx
+
+USER_AGENT = "blogpack/0.1.0 (offline reader)"
+
+# The downloader's widest semaphore (images) is sized to this, so requests
+# never queue inside httpx and every connection stays warm between phases
+POOL_SIZE = 20
+CLIENT_LIMITS = httpx.Limits(
+    max_connections=POOL_SIZE,
+    max_keepalive_connections=POOL_SIZE,
+    keepalive_expiry=30.0,
+)
+# Retries failed connection attempts only (nothing has been sent yet), so a
+# CDN briefly refusing connections doesn't fail an image outright
+CONNECT_RETRIES = 2
+
+
+def create_client(verify_ssl: bool = True) -> httpx.AsyncClient:
+    """Create an HTTP/2 client meant to be shared by every request in a job."""
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        limits=CLIENT_LIMITS,
+        retries=CONNECT_RETRIES,
+        verify=verify_ssl,
+    )
+    return httpx.AsyncClient(
+        transport=transport,
+        follow_redirects=True,
+        timeout=httpx.Timeout(30.0, connect=10.0),
+        headers={"User-Agent": USER_AGENT},
+        verify=verify_ssl,
+    )
+
+
+@asynccontextmanager
+async def client_session(
+    client: httpx.AsyncClient | None = None,
+    verify_ssl: bool = True,
+) -> AsyncIterator[httpx.AsyncClient]:
+    """Use the given client, or a temporary one closed on exit if None."""
+    if client is not None:
+        yield client
+        return
+    async with create_client(verify_ssl) as own_client:
+        yield own_client
@@ -1,31 +1,87 @@
 """Crawl blog to discover all posts."""
 
+import asyncio
+import time
+from collections import defaultdict
+from urllib.parse import urlsplit, urlunsplit
+
 import httpx
 from rich.console import Console
 
+from .client import client_session
 from .platforms import detect_platform, BlogPlatform, PLATFORMS
 from .platforms.base import PostInfo
 
 console = Console()
 
+# Recently discovered post lists, keyed by (normalized URL, forced platform
+# name, verify_ssl)
+DISCOVERY_CACHE_TTL = 600  # seconds
+_DISCOVERY_CACHE: dict[tuple[str, str | None, bool], tuple[float, BlogPlatform, list[PostInfo]]] = {}
+# One lock per key so concurrent discoveries of the same blog share a single crawl
+_DISCOVERY_LOCKS: defaultdict[tuple[str, str | None, bool], asyncio.Lock] = defaultdict(asyncio.Lock)
+
 
-async def discover_posts(base_url: str, platform: BlogPlatform | None = None, verify_ssl: bool = True) -> tuple[BlogPlatform, list[PostInfo]]:
+async def discover_posts(
+    base_url: str,
+    platform: BlogPlatform | None = None,
+    verify_ssl: bool = True,
+    client: httpx.AsyncClient | None = None,
+) -> tuple[BlogPlatform, list[PostInfo]]:
     """
     Discover all posts on a blog.
 
+    Results are cached for DISCOVERY_CACHE_TTL seconds per blog URL.
+
     Args:
         base_url: The blog's base URL
         platform: Optional platform override (auto-detects if None)
+        client: Optional shared client to reuse (a temporary one is made if None)
 
     Returns:
         Tuple of (detected platform, list of post info)
     """
-    async with httpx.AsyncClient(
-        follow_redirects=True,
-        timeout=30.0,
-        headers={"User-Agent": "blogpack/0.1.0 (offline reader)"},
-        verify=verify_ssl,
-    ) as client:
+    key = (_normalize_url(base_url), platform.name if platform else None, verify_ssl)
+
+    async with _DISCOVERY_LOCKS[key]:
+        cached = _DISCOVERY_CACHE.get(key)
+        if cached and time.monotonic() - cached[0] < DISCOVERY_CACHE_TTL:
+            _, cached_platform, cached_posts = cached
+            console.print(f"[green]Using cached post list for {base_url} ({len(cached_posts)} posts)[/green]")
+            return cached_platform, list(cached_posts)
+
+        platform, posts = await _crawl(base_url, platform, verify_ssl, client)
+        _DISCOVERY_CACHE[key] = (time.monotonic(), platform, posts)
+        return platform, list(posts)
+
+
+def clear_discovery_cache(expired_only: bool = False):
+    """Drop cached discovery results (only the expired ones if expired_only)."""
+    now = time.monotonic()
+    for key, (ts, _, _) in list(_DISCOVERY_CACHE.items()):
+        if not expired_only or now - ts >= DISCOVERY_CACHE_TTL:
+            del _DISCOVERY_CACHE[key]
+    for key, lock in list(_DISCOVERY_LOCKS.items()):
+        if key not in _DISCOVERY_CACHE and not lock.locked():
+            del _DISCOVERY_LOCKS[key]
+
+
+def _normalize_url(url: str) -> str:
+    """Blog URL for cache keys: scheme and host are case-insensitive, paths aren't."""
+    parts = urlsplit(url.strip())
+    return urlunsplit(parts._replace(
+        scheme=parts.scheme.lower(), netloc=parts.netloc.lower(), path=parts.path.rstrip("/"),
+    ))
+
+
+async def _crawl(
+    base_url: str,
+    platform: BlogPlatform | None,
+    verify_ssl: bool,
+    client: httpx.AsyncClient | None,
+) -> tuple[BlogPlatform, list[PostInfo]]:
+    """Fetch the homepage, detect the platform and list its posts."""
+    async with client_session(client, verify_ssl) as client:
         # Fetch homepage to detect platform
         if platform is None:
             console.print(f"[dim]Fetching {base_url} to detect platform...[/dim]")
@@ -2,14 +2,25 @@
 
 import asyncio
 import hashlib
+import multiprocessing
+import os
 import random
+import sys
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from urllib.parse import urlparse, urljoin
+from typing import AsyncIterator, Literal
+from urllib.parse import urlparse
 
 import httpx
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 
+from .cache import load_json_cache, save_json_cache
+from .client import POOL_SIZE, client_session
 from .platforms.base import BlogPlatform, Article, PostInfo
 
 console = Console()
@@ -28,11 +39,205 @@ PLATFORM_RATE_LIMITS = {
 # Retry settings for 429 errors
 MAX_RETRIES = 5
 INITIAL_BACKOFF = 2.0  # seconds
+MAX_RETRY_AFTER = 60.0  # Cap on a server-requested wait, in seconds
+# After a 429 lowers concurrency, this many successes in a row raise it by one
+GATE_RECOVERY_SUCCESSES = 20
 
 # Image download settings (more aggressive since images are served from CDNs)
-IMAGE_MAX_CONCURRENT = 20
+IMAGE_MAX_CONCURRENT = POOL_SIZE  # One in-flight request per pooled connection
 IMAGE_REQUEST_DELAY = 0.05  # 50ms between image requests
 
+# Above this many posts, HTML extraction runs in a process pool so parsing
+# uses several cores and never stalls the event loop; smaller runs stay
+# in-process since starting workers costs more than it saves
+EXTRACT_POOL_MIN_POSTS = 32
+# Each worker holds its own lxml and interpreter, so the pool stays narrow on
+# many-core hosts
+EXTRACT_POOL_MAX_WORKERS = 4
+# Not fork: the parent already has threads (asyncio.to_thread) running
+_EXTRACT_MP_CONTEXT = multiprocessing.get_context("spawn" if sys.platform == "win32" else "forkserver")
+
+IMAGE_CHUNK_SIZE = 64 * 1024  # Images are hashed and written as they stream in
+MAX_IMAGE_BYTES = 25 * 1024 * 1024  # Larger images are skipped
+
+# Maps image URL -> {"path": filename in images/, "digest": full content hash},
+# so re-runs into the same output directory skip images they already have
+IMAGE_CACHE_FILENAME = ".blogpack_cache.json"
+
+# Kept in the post cache directory next to the cached HTML. Maps post URL ->
+# {"file": cached HTML filename, "lastmod": sitemap lastmod, "etag"/
+# "last_modified": response validators}, so re-runs only fetch posts that are
+# new or have changed
+POST_MANIFEST_FILENAME = ".blogpack_manifest.json"
+POST_CACHE_DIRNAME = ".blogpack_posts"
+
+# SHA-256 runs on the CPU's SHA extensions where present, and there beats MD5
+# several times over
+try:
+    from blake3 import blake3 as _content_hasher
+except ImportError:
+    _content_hasher = hashlib.sha256
+
+# Hex digits of the content hash kept in image filenames. A clash would make
+# the second image point at the first one's file; 64 bits makes that
+# negligible, and hex stays unique on case-insensitive filesystems
+IMAGE_NAME_HASH_LENGTH = 16
+
+
+def _finalize_image(part_path: Path, filepath: Path):
+    """Move a finished download into place, unless another URL already produced the same file."""
+    if filepath.exists():
+        part_path.unlink()
+    else:
+        os.replace(part_path, filepath)
+
+
+def _file_names(directory: Path) -> set[str]:
+    """Names of the entries in directory, or none if it doesn't exist."""
+    try:
+        with os.scandir(directory) as it:
+            return {entry.name for entry in it}
+    except OSError:
+        return set()
+
+
+def _write_post_cache(cache_dir: Path, filename: str, html: str):
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    (cache_dir / filename).write_text(html, encoding="utf-8")
+
+
+def _read_post_cache(cache_file: Path) -> str | None:
+    """Cached post HTML, or None if it has gone missing."""
+    try:
+        return cache_file.read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def _retry_wait(response: httpx.Response, backoff: float) -> float:
+    """Seconds to wait after a 429: the server's Retry-After if given, else backoff with jitter."""
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            wait = float(retry_after)
+        except ValueError:
+            try:
+                wait = parsedate_to_datetime(retry_after).timestamp() - time.time()
+            except (TypeError, ValueError):
+                wait = None
+        if wait is not None:
+            return min(max(wait, 0.0), MAX_RETRY_AFTER)
+    return backoff * random.uniform(0.5, 1.5)
+
+
+@asynccontextmanager
+async def _extract_pool(post_count: int, max_workers: int | None) -> AsyncIterator[ProcessPoolExecutor | None]:
+    """A process pool for extract_article, or None if there are too few posts to bother."""
+    if max_workers is None:
+        max_workers = min(EXTRACT_POOL_MAX_WORKERS, os.cpu_count() or 1)
+    if post_count <= EXTRACT_POOL_MIN_POSTS or max_workers < 1:
+        yield None
+        return
+    pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=_EXTRACT_MP_CONTEXT)
+    try:
+        yield pool
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def _map_bounded(fn, items: list, limit: int) -> list:
+    """Await fn(item) for every item, at most `limit` at a time, returning results in order.
+
+    Only `limit` worker tasks ever exist, where gather would create one task
+    per item up front.
+    """
+    results = [None] * len(items)
+    pending = iter(enumerate(items))
+
+    async def worker():
+        # Workers share one iterator, so each item is taken exactly once
+        for index, item in pending:
+            results[index] = await fn(item)
+
+    await asyncio.gather(*(worker() for _ in range(min(limit, len(items)))))
+    return results
+
+
+class _TokenBucket:
+    """Paces requests to `rate` per second, letting up to `burst` go at once."""
+
+    def __init__(self, rate: float, burst: int):
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        # Waiters queue on the lock, so tokens are handed out in arrival order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
+class _ConcurrencyGate:
+    """Caps requests in flight at a limit that adapts to rate limiting.
+
+    Each 429 lowers the limit by one (down to 1); every GATE_RECOVERY_SUCCESSES
+    requests in a row that succeed grow it back by one, up to where it started.
+    """
+
+    def __init__(self, limit: int):
+        self._max_limit = limit
+        self._limit = limit
+        self._active = 0
+        self._successes = 0
+        self._cond = asyncio.Condition()
+
+    async def __aenter__(self):
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._active < self._limit)
+            self._active += 1
+
+    async def __aexit__(self, *exc_info):
+        async with self._cond:
+            self._active -= 1
+            # Wake one waiter per free slot; more than one if the limit just grew
+            self._cond.notify(self._limit - self._active)
+
+    def record(self, status_code: int):
+        """Adjust the limit for a response received inside the gate."""
+        if status_code == 429:
+            self._limit = max(1, self._limit - 1)
+            self._successes = 0
+        elif self._limit < self._max_limit:
+            self._successes += 1
+            if self._successes >= GATE_RECOVERY_SUCCESSES:
+                self._limit += 1
+                self._successes = 0
+
+
+class _HostPacers:
+    """A _TokenBucket per host, so each destination (blog, image CDN) is paced on its own."""
+
+    def __init__(self, rate: float, burst: int):
+        self._rate = rate
+        self._burst = burst
+        self._buckets: dict[str, _TokenBucket] = {}
+
+    async def acquire(self, url: str):
+        host = urlparse(url).netloc
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = _TokenBucket(self._rate, self._burst)
+        await bucket.acquire()
+
 
 async def download_posts(
     base_url: str,
@@ -41,6 +246,10 @@ async def download_posts(
     include_images: bool = True,
     output_dir: Path | None = None,
     verify_ssl: bool = True,
+    client: httpx.AsyncClient | None = None,
+    rps: float | None = None,
+    post_cache_dir: Path | None = None,
+    extract_workers: int | None = None,
 ) -> tuple[list[Article], dict[str, Path]]:
     """
     Download all posts and their images.
@@ -51,6 +260,12 @@ async def download_posts(
         platform: The blog platform handler
         include_images: Whether to download images
         output_dir: Directory to save images (if include_images is True)
+        client: Optional shared client to reuse (a temporary one is made if None)
+        rps: Post requests per second per host, overriding the platform's default pacing
+        post_cache_dir: Directory to keep fetched posts in between runs, so later runs
+            only fetch posts that are new or changed (None disables the cache)
+        extract_workers: Processes to extract large batches of posts in (None for up to
+            EXTRACT_POOL_MAX_WORKERS, 0 to extract in-process)
 
     Returns:
         Tuple of (list of Article objects, dict mapping image URL to local path)
@@ -61,20 +276,36 @@ async def download_posts(
         {"max_concurrent": DEFAULT_MAX_CONCURRENT, "request_delay": DEFAULT_REQUEST_DELAY}
     )
     max_concurrent = rate_limits["max_concurrent"]
-    request_delay = rate_limits["request_delay"]
+    if rps is None:
+        # Same average rate as one request per request_delay per slot, without
+        # making every request sleep first
+        rps = max_concurrent / rate_limits["request_delay"]
 
-    console.print(f"[dim]Using rate limits for {platform.name}: {max_concurrent} concurrent, {request_delay}s delay[/dim]")
+    console.print(f"[dim]Using rate limits for {platform.name}: {max_concurrent} concurrent, {rps:g} requests/s[/dim]")
 
     articles = []
     image_map: dict[str, Path] = {}
-    semaphore = asyncio.Semaphore(max_concurrent)
-
-    async with httpx.AsyncClient(
-        follow_redirects=True,
-        timeout=30.0,
-        headers={"User-Agent": "blogpack/0.1.0 (offline reader)"},
-        verify=verify_ssl,
-    ) as client:
+    pacers = _HostPacers(rps, burst=max_concurrent)
+    post_gate = _ConcurrencyGate(max_concurrent)
+    loop = asyncio.get_running_loop()
+
+    manifest: dict[str, dict] = {}
+    if post_cache_dir:
+        manifest_path = post_cache_dir / POST_MANIFEST_FILENAME
+        manifest = await asyncio.to_thread(load_json_cache, manifest_path)
+
+    def record_post(post: PostInfo, filename: str, response: httpx.Response, previous: dict | None = None):
+        """Remember a fetched post's sitemap lastmod and validators for the next run."""
+        previous = previous or {}
+        manifest[post.url] = {
+            "file": filename,
+            "lastmod": post.last_modified.isoformat() if post.last_modified else None,
+            # A 304 may omit validators it isn't changing
+            "etag": response.headers.get("ETag") or previous.get("etag"),
+            "last_modified": response.headers.get("Last-Modified") or previous.get("last_modified"),
+        }
+
+    async with client_session(client, verify_ssl) as client, _extract_pool(len(posts), extract_workers) as extract_pool:
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -85,122 +316,240 @@ async def download_posts(
             # Download posts
             task = progress.add_task("[cyan]Downloading posts...", total=len(posts))
 
-            skipped_count = 0
-
-            async def download_post(post: PostInfo) -> Article | None:
-                nonlocal skipped_count
-                async with semaphore:
+            async def extract(html: str, post: PostInfo) -> Article | Literal["skipped"]:
+                if extract_pool is not None:
+                    # Platforms are stateless, so they pickle to the workers as-is
+                    article = await loop.run_in_executor(extract_pool, platform.extract_article, html, post.url)
+                else:
+                    article = platform.extract_article(html, post.url)
+                progress.advance(task)
+                return "skipped" if article is None else article
+
+            async def download_post(post: PostInfo) -> Article | Literal["skipped"] | None:
+                """Returns the article, "skipped" if paywalled, or None on failure."""
+                entry = manifest.get(post.url)
+                cached_html = None
+                if entry:
+                    cached_html = await asyncio.to_thread(_read_post_cache, post_cache_dir / entry["file"])
+                if cached_html is not None:
+                    # The sitemap says the post hasn't changed since it was cached
+                    if post.last_modified and entry.get("lastmod") == post.last_modified.isoformat():
+                        try:
+                            return await extract(cached_html, post)
+                        except Exception as e:
+                            console.print(f"[yellow]Warning: Failed to extract cached {post.url}: {e}[/yellow]")
+                            progress.advance(task)
+                            return None
+                    headers = {}
+                    if entry.get("etag"):
+                        headers["If-None-Match"] = entry["etag"]
+                    if entry.get("last_modified"):
+                        headers["If-Modified-Since"] = entry["last_modified"]
+                else:
+                    headers = None
+
+                retries = 0
+                backoff = INITIAL_BACKOFF
+                while retries <= MAX_RETRIES:
+                    try:
+                        await pacers.acquire(post.url)
+                        async with post_gate:
+                            response = await client.get(post.url, headers=headers)
+                            post_gate.record(response.status_code)
+
+                        if response.status_code == 304 and cached_html is not None:
+                            record_post(post, entry["file"], response, entry)
+                            return await extract(cached_html, post)
+
+                        # Handle 429 Too Many Requests with exponential backoff
+                        if response.status_code == 429:
+                            retries += 1
+                            if retries > MAX_RETRIES:
+                                console.print(f"[yellow]Warning: Max retries reached for {post.url}[/yellow]")
+                                progress.advance(task)
+                                return None
+                            wait_time = _retry_wait(response, backoff)
+                            console.print(f"[yellow]Rate limited, waiting {wait_time:.1f}s before retry...[/yellow]")
+                            await asyncio.sleep(wait_time)
+                            backoff *= 2  # Exponential backoff
+                            continue
+
+                        response.raise_for_status()
+                        html = response.text
+                        if post_cache_dir:
+                            filename = f"{hashlib.sha1(post.url.encode()).hexdigest()}.html"
+                            await asyncio.to_thread(_write_post_cache, post_cache_dir, filename, html)
+                            record_post(post, filename, response)
+                        return await extract(html, post)
+                    except httpx.HTTPStatusError as e:
+                        if e.response.status_code == 429:
+                            retries += 1
+                            if retries > MAX_RETRIES:
+                                console.print(f"[yellow]Warning: Max retries reached for {post.url}[/yellow]")
+                                progress.advance(task)
+                                return None
+                            wait_time = _retry_wait(e.response, backoff)
+                            console.print(f"[yellow]Rate limited, waiting {wait_time:.1f}s before retry...[/yellow]")
+                            await asyncio.sleep(wait_time)
+                            backoff *= 2
+                            continue
+                        console.print(f"[yellow]Warning: Failed to download {post.url}: {e}[/yellow]")
+                        progress.advance(task)
+                        return None
+                    except Exception as e:
+                        console.print(f"[yellow]Warning: Failed to download {post.url}: {e}[/yellow]")
+                        progress.advance(task)
+                        return None
+                return None
+
+            # Images download while posts are still coming in: each article's
+            # images are queued as soon as it has been extracted
+            image_workers = []
+            if include_images and output_dir:
+                images_dir = output_dir / "images"
+                cache_path = output_dir / IMAGE_CACHE_FILENAME
+                image_cache = await asyncio.to_thread(load_json_cache, cache_path)
+                # Listed once up front so queue_images never stats files on the loop
+                existing_images = await asyncio.to_thread(_file_names, images_dir)
+                # Content hash -> filename, so the same bytes served from another URL
+                # (or with another extension) reuse one file, across runs too
+                files_by_digest = {
+                    entry["digest"]: entry["path"] for entry in image_cache.values() if "digest" in entry
+                }
+                seen_images: set[str] = set()
+                image_queue: asyncio.Queue[str | None] = asyncio.Queue()
+                img_task = None
+                queued_count = 0
+                reused_count = 0
+
+                # Use separate, more aggressive settings for images (CDNs can handle it)
+                image_pacers = _HostPacers(IMAGE_MAX_CONCURRENT / IMAGE_REQUEST_DELAY, burst=IMAGE_MAX_CONCURRENT)
+                image_gate = _ConcurrencyGate(IMAGE_MAX_CONCURRENT)
+
+                def queue_images(article: Article):
+                    nonlocal img_task, queued_count, reused_count
+                    for url in article.image_urls:
+                        if url in seen_images:
+                            continue
+                        seen_images.add(url)
+                        # Images fetched by an earlier run need no request at all
+                        entry = image_cache.get(url)
+                        if entry and entry["path"] in existing_images:
+                            image_map[url] = images_dir / entry["path"]
+                            reused_count += 1
+                            continue
+                        if img_task is None:
+                            images_dir.mkdir(parents=True, exist_ok=True)
+                            console.print(f"[dim]Downloading images ({IMAGE_MAX_CONCURRENT} concurrent)[/dim]")
+                            img_task = progress.add_task("[cyan]Downloading images...", total=0)
+                        queued_count += 1
+                        progress.update(img_task, total=queued_count)
+                        image_queue.put_nowait(url)
+
+                async def download_image(url: str) -> tuple[str, Path | None]:
                     retries = 0
                     backoff = INITIAL_BACKOFF
                     while retries <= MAX_RETRIES:
+                        part_path = images_dir / f".{uuid.uuid4().hex}.part"
                         try:
-                            await asyncio.sleep(request_delay)
-                            response = await client.get(post.url)
-
-                            # Handle 429 Too Many Requests with exponential backoff
-                            if response.status_code == 429:
-                                retries += 1
-                                if retries > MAX_RETRIES:
-                                    console.print(f"[yellow]Warning: Max retries reached for {post.url}[/yellow]")
-                                    progress.advance(task)
-                                    return None
-                                # Add jitter to backoff
-                                jitter = random.uniform(0.5, 1.5)
-                                wait_time = backoff * jitter
-                                console.print(f"[yellow]Rate limited, waiting {wait_time:.1f}s before retry...[/yellow]")
-                                await asyncio.sleep(wait_time)
-                                backoff *= 2  # Exponential backoff
-                                continue
-
-                            response.raise_for_status()
-                            article = platform.extract_article(response.text, post.url)
-                            if article is None:
-                                skipped_count += 1
-                            progress.advance(task)
-                            return article
-                        except httpx.HTTPStatusError as e:
-                            if e.response.status_code == 429:
+                            await image_pacers.acquire(url)
+                            async with image_gate, client.stream("GET", url) as response:
+                                image_gate.record(response.status_code)
+                                rate_limited = response.status_code == 429
+                                if rate_limited:
+                                    wait_time = _retry_wait(response, backoff)
+                                else:
+                                    response.raise_for_status()
+                                    if int(response.headers.get("Content-Length") or 0) > MAX_IMAGE_BYTES:
+                                        raise ValueError(f"larger than {MAX_IMAGE_BYTES} bytes")
+                                    # Stream to a temp file, hashing as we go, so
+                                    # only one chunk of the image is in memory.
+                                    # Disk writes run in threads to keep the loop free
+                                    hasher = _content_hasher()
+                                    f = await asyncio.to_thread(open, part_path, "wb")
+                                    try:
+                                        # Content-Length can be absent or wrong, so count too
+                                        size = 0
+                                        async for chunk in response.aiter_bytes(IMAGE_CHUNK_SIZE):
+                                            size += len(chunk)
+                                            if size > MAX_IMAGE_BYTES:
+                                                raise ValueError(f"larger than {MAX_IMAGE_BYTES} bytes")
+                                            hasher.update(chunk)
+                                            await asyncio.to_thread(f.write, chunk)
+                                    finally:
+                                        await asyncio.to_thread(f.close)
+
+                            # Handle 429 with backoff (after the connection is released)
+                            if rate_limited:
                                 retries += 1
                                 if retries > MAX_RETRIES:
-                                    console.print(f"[yellow]Warning: Max retries reached for {post.url}[/yellow]")
-                                    progress.advance(task)
-                                    return None
-                                jitter = random.uniform(0.5, 1.5)
-                                wait_time = backoff * jitter
-                                console.print(f"[yellow]Rate limited, waiting {wait_time:.1f}s before retry...[/yellow]")
+                                    progress.advance(img_task)
+                                    return url, None
                                 await asyncio.sleep(wait_time)
                                 backoff *= 2
                                 continue
-                            console.print(f"[yellow]Warning: Failed to download {post.url}: {e}[/yellow]")
-                            progress.advance(task)
-                            return None
-                        except Exception as e:
-                            console.print(f"[yellow]Warning: Failed to download {post.url}: {e}[/yellow]")
-                            progress.advance(task)
-                            return None
-                    return None
-
-            results = await asyncio.gather(*[download_post(p) for p in posts])
-            articles = [a for a in results if a is not None]
-
-            if skipped_count > 0:
-                console.print(f"[yellow]Skipped {skipped_count} premium/paywalled posts[/yellow]")
-
-            # Download images if requested
-            if include_images and output_dir:
-                all_images = set()
-                for article in articles:
-                    all_images.update(article.image_urls)
-
-                if all_images:
-                    images_dir = output_dir / "images"
-                    images_dir.mkdir(parents=True, exist_ok=True)
-
-                    # Use separate, more aggressive settings for images (CDNs can handle it)
-                    image_semaphore = asyncio.Semaphore(IMAGE_MAX_CONCURRENT)
-                    console.print(f"[dim]Downloading {len(all_images)} images ({IMAGE_MAX_CONCURRENT} concurrent)[/dim]")
-
-                    img_task = progress.add_task("[cyan]Downloading images...", total=len(all_images))
-
-                    async def download_image(url: str) -> tuple[str, Path | None]:
-                        async with image_semaphore:
-                            retries = 0
-                            backoff = INITIAL_BACKOFF
-                            while retries <= MAX_RETRIES:
-                                try:
-                                    await asyncio.sleep(IMAGE_REQUEST_DELAY)
-                                    response = await client.get(url)
-
-                                    # Handle 429 with backoff
-                                    if response.status_code == 429:
-                                        retries += 1
-                                        if retries > MAX_RETRIES:
-                                            progress.advance(img_task)
-                                            return url, None
-                                        wait_time = backoff * random.uniform(0.5, 1.5)
-                                        await asyncio.sleep(wait_time)
-                                        backoff *= 2
-                                        continue
-
-                                    response.raise_for_status()
 
-                                    # Generate filename from URL and content hash
-                                    parsed = urlparse(url)
-                                    ext = Path(parsed.path).suffix or ".jpg"
-                                    content_hash = hashlib.md5(response.content).hexdigest()[:8]
-                                    filename = f"{content_hash}{ext}"
-                                    filepath = images_dir / filename
-
-                                    filepath.write_bytes(response.content)
-                                    progress.advance(img_task)
-                                    return url, filepath
-                                except Exception as e:
-                                    console.print(f"[yellow]Warning: Failed to download image {url}: {e}[/yellow]")
-                                    progress.advance(img_task)
-                                    return url, None
+                            # Generate filename from URL and content hash
+                            parsed = urlparse(url)
+                            ext = Path(parsed.path).suffix or ".jpg"
+                            full_hash = hasher.hexdigest()
+                            filename = files_by_digest.get(full_hash)
+                            if filename is None:
+                                filename = f"{full_hash[:IMAGE_NAME_HASH_LENGTH]}{ext}"
+                                files_by_digest[full_hash] = filename
+                            filepath = images_dir / filename
+
+                            # Another URL may already have fetched the same bytes
+                            await asyncio.to_thread(_finalize_image, part_path, filepath)
+                            image_cache[url] = {"path": filename, "digest": full_hash}
+                            progress.advance(img_task)
+                            return url, filepath
+                        except Exception as e:
+                            part_path.unlink(missing_ok=True)
+                            console.print(f"[yellow]Warning: Failed to download image {url}: {e}[/yellow]")
+                            progress.advance(img_task)
                             return url, None
-
-                    img_results = await asyncio.gather(*[download_image(url) for url in all_images])
-                    image_map = {url: path for url, path in img_results if path is not None}
+                    return url, None
+
+                async def image_worker():
+                    while (url := await image_queue.get()) is not None:
+                        url, path = await download_image(url)
+                        if path is not None:
+                            image_map[url] = path
+
+                image_workers = [asyncio.create_task(image_worker()) for _ in range(IMAGE_MAX_CONCURRENT)]
+
+            async def fetch_post(post: PostInfo) -> Article | Literal["skipped"] | None:
+                result = await download_post(post)
+                if image_workers and isinstance(result, Article):
+                    queue_images(result)
+                return result
+
+            try:
+                skipped_count = 0
+                for result in await _map_bounded(fetch_post, posts, max_concurrent):
+                    if result == "skipped":
+                        skipped_count += 1
+                    elif result is not None:
+                        articles.append(result)
+
+                if skipped_count > 0:
+                    console.print(f"[yellow]Skipped {skipped_count} premium/paywalled posts[/yellow]")
+                if post_cache_dir and manifest:
+                    await asyncio.to_thread(save_json_cache, manifest_path, manifest)
+
+                # No more images are coming; let the workers drain the queue
+                for _ in image_workers:
+                    image_queue.put_nowait(None)
+                await asyncio.gather(*image_workers)
+            finally:
+                for worker in image_workers:
+                    worker.cancel()
+
+            if image_workers:
+                if reused_count:
+                    console.print(f"[dim]Reused {reused_count} previously downloaded images[/dim]")
+                if queued_count:
+                    await asyncio.to_thread(save_json_cache, cache_path, image_cache)
 
     return articles, image_map
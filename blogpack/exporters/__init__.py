@@ -3,5 +3,6 @@
 from .html import export_html
 from .epub import export_epub
 from .pdf import export_pdf
+from .content import clear_content_cache
 
-__all__ = ["export_html", "export_epub", "export_pdf"]
+__all__ = ["export_html", "export_epub", "export_pdf", "clear_content_cache"]
@@ -0,0 +1,99 @@
+"""Article HTML shared by the exporters."""
+
+import hashlib
+from datetime import datetime, timezone
+from pathlib import Path
+
+from ..platforms.base import Article
+from ..cleaner import clean_html
+from ..linker import rewrite_links
+
+# Exporting several formats from the same articles in one process cleans
+# each article only once. Keyed by a digest of the raw HTML, so equal content
+# hits the cache even when the Article objects differ (e.g. after unpickling)
+_CLEAN_CACHE: dict[bytes, str] = {}
+_REWRITE_CACHE: dict[tuple[bytes, str, str, bytes], str] = {}
+
+# (id(slug_index), id(image_map)) -> (slug_index, image_map, digest of both).
+# Each exporter builds its own slug_index, so rewrites are keyed by content;
+# the digest is computed once per pair of dicts, and holding them keeps their
+# ids from being reused while the entry exists
+_LINK_TARGETS: dict[tuple[int, int], tuple[dict, dict | None, bytes]] = {}
+
+# Undated articles sort as the oldest
+_NO_DATE = datetime.min.replace(tzinfo=timezone.utc)
+
+
+def get_cleaned(
+    article: Article,
+    base_url: str,
+    slug_index: dict[str, str],
+    image_map: dict[str, Path] | None = None,
+    relative_image_path: str = "images",
+) -> str:
+    """
+    Clean an article's HTML and rewrite its links for local reading.
+
+    Results are cached until clear_content_cache() is called. slug_index and
+    image_map are assumed not to change while in use.
+
+    Args:
+        article: The article to prepare
+        base_url: The blog's base URL
+        slug_index: Dict mapping link paths to post slugs (see get_slug_index)
+        image_map: Optional dict mapping image URLs to local paths
+        relative_image_path: Prefix for rewritten image sources
+
+    Returns:
+        Cleaned HTML with internal links and images pointing at local copies
+    """
+    digest = hashlib.blake2b(article.content_html.encode(), digest_size=16).digest()
+    key = (digest, base_url, relative_image_path, _link_targets_digest(slug_index, image_map))
+    content = _REWRITE_CACHE.get(key)
+    if content is None:
+        cleaned = _CLEAN_CACHE.get(digest)
+        if cleaned is None:
+            cleaned = _CLEAN_CACHE[digest] = clean_html(article.content_html)
+        content = _REWRITE_CACHE[key] = rewrite_links(
+            cleaned, base_url, slug_index, image_map, relative_image_path=relative_image_path
+        )
+    return content
+
+
+def _link_targets_digest(slug_index: dict[str, str], image_map: dict[str, Path] | None) -> bytes:
+    """Digest of what rewrite_links points links and images at."""
+    ids = (id(slug_index), id(image_map))
+    cached = _LINK_TARGETS.get(ids)
+    if cached is not None:
+        return cached[2]
+    h = hashlib.blake2b(digest_size=16)
+    h.update("\0".join(sorted(f"{path}\0{slug}" for path, slug in slug_index.items())).encode())
+    if image_map is not None:
+        h.update(b"\1")
+        h.update("\0".join(sorted(f"{url}\0{path}" for url, path in image_map.items())).encode())
+    digest = h.digest()
+    _LINK_TARGETS[ids] = (slug_index, image_map, digest)
+    return digest
+
+
+def clear_content_cache():
+    """Release cached article HTML once every format has been exported."""
+    _CLEAN_CACHE.clear()
+    _REWRITE_CACHE.clear()
+    _LINK_TARGETS.clear()
+
+
+def date_sort_key(article: Article) -> datetime:
+    """
+    Sort key ordering articles by publication date.
+
+    Dates may be naive or timezone-aware (depending on where the platform
+    found them), and the two can't be compared, so naive dates are taken
+    as UTC. Undated articles sort first.
+    """
+    date = article.date
+    if date is None:
+        return _NO_DATE
+    if date.tzinfo is None:
+        return date.replace(tzinfo=timezone.utc)
+    return date
@@ -1,5 +1,7 @@
 """Export blog to EPUB format."""
 
+import re
+import zipfile
 from pathlib import Path
 from datetime import datetime
 
@@ -7,11 +9,24 @@ from ebooklib import epub
 from rich.console import Console
 
 from ..platforms.base import Article
-from ..cleaner import clean_html, READER_CSS
-from ..linker import rewrite_links, get_all_slugs
+from ..cleaner import READER_CSS
+from ..linker import get_slug_index
+from .content import date_sort_key, get_cleaned
 
 console = Console()
 
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+# Image file extension -> EPUB media type (anything else is assumed JPEG)
+_IMAGE_MEDIA_TYPES = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+    ".svg": "image/svg+xml",
+}
+
 
 def export_epub(
     articles: list[Article],
@@ -20,6 +35,7 @@ def export_epub(
     image_map: dict[str, Path] | None = None,
     blog_title: str = "Blog Archive",
     blog_author: str = "Unknown",
+    out_zip: zipfile.ZipFile | None = None,
 ) -> Path:
     """
     Export articles to EPUB format.
@@ -31,9 +47,11 @@ def export_epub(
         image_map: Dict mapping image URLs to local paths
         blog_title: Book title
         blog_author: Book author
+        out_zip: Add the EPUB to this archive instead of leaving it in output_dir
 
     Returns:
-        Path to the generated EPUB file
+        Path to the generated EPUB file (relative to the archive root when
+        out_zip is given)
     """
     console.print(f"[dim]Generating EPUB with {len(articles)} chapters...[/dim]")
 
@@ -58,65 +76,38 @@ def export_epub(
     # Sort articles by date (oldest first for reading order)
     sorted_articles = sorted(
         articles,
-        key=lambda a: a.date or datetime.min,
+        key=date_sort_key,
     )
 
-    post_slugs = get_all_slugs(articles)
+    slug_index = get_slug_index(articles)
     chapters = []
-    image_items = {}
 
     # Add images to epub first (track added files to avoid duplicates)
     added_files = set()
     if image_map:
-        for url, local_path in image_map.items():
+        for local_path in image_map.values():
+            # Skip if we already added this file (multiple URLs can map to same file)
+            if local_path.name in added_files:
+                continue
             if local_path.exists():
-                # Skip if we already added this file (multiple URLs can map to same file)
-                if local_path.name in added_files:
-                    image_items[url] = f"images/{local_path.name}"
-                    continue
                 added_files.add(local_path.name)
 
-                # Determine media type
-                ext = local_path.suffix.lower()
-                media_types = {
-                    ".jpg": "image/jpeg",
-                    ".jpeg": "image/jpeg",
-                    ".png": "image/png",
-                    ".gif": "image/gif",
-                    ".webp": "image/webp",
-                    ".svg": "image/svg+xml",
-                }
-                media_type = media_types.get(ext, "image/jpeg")
-
-                img_item = epub.EpubItem(
+                img_item = _ImageFileItem(
+                    local_path,
                     uid=f"img_{local_path.stem}",
                     file_name=f"images/{local_path.name}",
-                    media_type=media_type,
-                    content=local_path.read_bytes(),
+                    media_type=_IMAGE_MEDIA_TYPES.get(local_path.suffix.lower(), "image/jpeg"),
                 )
                 book.add_item(img_item)
-                image_items[url] = f"images/{local_path.name}"
 
     # Create chapters
     for i, article in enumerate(sorted_articles):
         date_str = article.date.strftime("%B %d, %Y") if article.date else ""
 
-        # Clean content and rewrite links
-        content = clean_html(article.content_html)
-
-        # Rewrite links for epub (internal links to other chapters)
-        content = rewrite_links(
-            content,
-            base_url,
-            post_slugs,
-            image_map,
-            relative_image_path="images",
-        )
-
-        # Also rewrite image paths for epub
-        if image_items:
-            for url, epub_path in image_items.items():
-                content = content.replace(f'src="images/{Path(image_map[url]).name}"', f'src="{epub_path}"')
+        # Clean content and rewrite links (internal links to other chapters).
+        # Images are stored under the same images/<name> path rewrite_links
+        # emits, so their src needs no further rewriting
+        content = get_cleaned(article, base_url, slug_index, image_map, relative_image_path="images")
 
         # Create chapter HTML
         chapter_html = f"""
@@ -157,14 +148,37 @@ def export_epub(
     epub_path = output_dir / f"{_slugify(blog_title)}.epub"
     epub.write_epub(str(epub_path), book)
 
+    if out_zip is not None:
+        # ebooklib needs a real file: the mimetype entry must be a plain
+        # stored header, which an unseekable zip entry stream can't give it
+        out_zip.write(epub_path, arcname=epub_path.name)
+        epub_path.unlink()
+        epub_path = Path(epub_path.name)
+
     console.print(f"[green]EPUB export complete: {epub_path}[/green]")
     return epub_path
 
 
+class _ImageFileItem(epub.EpubItem):
+    """An image item read from disk only when ebooklib writes it.
+
+    ebooklib holds item content until write_epub, so reading every image
+    up front would keep the whole image set in memory at once. Nothing is
+    held open in between either, so large books don't run out of file
+    descriptors.
+    """
+
+    def __init__(self, local_path: Path, **kwargs):
+        super().__init__(**kwargs)
+        self.local_path = local_path
+
+    def get_content(self, default=None):
+        return self.local_path.read_bytes()
+
+
 def _slugify(text: str) -> str:
     """Convert text to a safe filename."""
-    import re
     text = text.lower()
-    text = re.sub(r"[^a-z0-9]+", "-", text)
+    text = _SLUG_RE.sub("-", text)
     text = text.strip("-")
     return text or "book"
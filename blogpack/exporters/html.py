@@ -1,15 +1,51 @@
 """Export blog to HTML folder."""
 
+import hashlib
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from html import escape
 from pathlib import Path
 
 from rich.console import Console
 
+from .. import __version__
+from ..cache import load_json_cache, save_json_cache
 from ..platforms.base import Article
-from ..cleaner import wrap_article_html, clean_html, READER_CSS
-from ..linker import rewrite_links, get_all_slugs
+from ..cleaner import wrap_article_html, READER_CSS
+from ..linker import get_slug_index
+from .content import date_sort_key, get_cleaned
 
 console = Console()
 
+# Per-page keys from the last export into a folder, so an unchanged page is
+# neither rebuilt nor rewritten on the next run
+EXPORT_MANIFEST = ".blogpack_export.json"
+
+# A page rendered from placeholders, so editing the page template or
+# READER_CSS (whose minified copy it embeds) invalidates every page
+_PAGE_TEMPLATE = wrap_article_html("\0title", "\0author", "\0date", "\0content")
+
+# The index page's stylesheet; only the table of contents varies per export
+_INDEX_CSS = READER_CSS + """
+ul {
+    list-style: none;
+    padding: 0;
+}
+li {
+    padding: 0.5rem 0;
+    border-bottom: 1px solid #eee;
+}
+li a {
+    text-decoration: none;
+}
+li a:hover {
+    text-decoration: underline;
+}
+.date {
+    color: #666;
+    font-size: 0.85rem;
+}"""
+
 
 def export_html(
     articles: list[Article],
@@ -17,6 +53,7 @@ def export_html(
     base_url: str,
     image_map: dict[str, Path] | None = None,
     blog_title: str = "Blog Archive",
+    out_zip: zipfile.ZipFile | None = None,
 ) -> Path:
     """
     Export articles to a folder of HTML files.
@@ -27,62 +64,112 @@ def export_html(
         base_url: Original blog URL
         image_map: Dict mapping image URLs to local paths
         blog_title: Title for the index page
+        out_zip: Write the files into this archive instead of output_dir
 
     Returns:
-        Path to the HTML output directory
+        Path to the HTML output directory (relative to the archive root
+        when out_zip is given)
     """
-    html_dir = output_dir / "html"
-    html_dir.mkdir(parents=True, exist_ok=True)
+    if out_zip is not None:
+        html_dir = Path("html")
+    else:
+        html_dir = output_dir / "html"
+        html_dir.mkdir(parents=True, exist_ok=True)
 
     # Sort articles by date (newest first)
     sorted_articles = sorted(
         articles,
-        key=lambda a: a.date or "",
+        key=date_sort_key,
         reverse=True,
     )
 
-    post_slugs = get_all_slugs(articles)
+    slug_index = get_slug_index(articles)
     console.print(f"[dim]Exporting {len(articles)} articles to HTML...[/dim]")
 
-    # Export each article
-    for article in sorted_articles:
+    def render(article: Article) -> str:
         date_str = article.date.strftime("%B %d, %Y") if article.date else ""
 
         # Clean and rewrite links in content
-        content = clean_html(article.content_html)
-        content = rewrite_links(content, base_url, post_slugs, image_map)
+        content = get_cleaned(article, base_url, slug_index, image_map)
 
         # Wrap in full HTML document
-        html = wrap_article_html(
+        return wrap_article_html(
             title=article.title,
             author=article.author,
             date_str=date_str,
             content_html=content,
         )
 
-        # Save to file
-        filepath = html_dir / f"{article.slug}.html"
-        filepath.write_text(html, encoding="utf-8")
+    # Export each article. lxml releases the GIL while parsing and
+    # serializing, so articles render in parallel threads
+    with ThreadPoolExecutor() as pool:
+        if out_zip is not None:
+            # Add entries in order from this thread so the archive layout is stable
+            for article, html in zip(sorted_articles, pool.map(render, sorted_articles)):
+                _write_file(html_dir / f"{article.slug}.html", html, out_zip)
+        else:
+            manifest_path = html_dir / EXPORT_MANIFEST
+            previous = load_json_cache(manifest_path)
+            manifest: dict[str, str] = {}
+            export_digest = _export_digest(base_url, slug_index, image_map)
+
+            def save(article: Article) -> None:
+                filename = f"{article.slug}.html"
+                key = manifest[filename] = _page_key(article, export_digest)
+                if previous.get(filename) == key and (html_dir / filename).exists():
+                    return
+                _write_file(html_dir / filename, render(article), None)
+
+            # Each thread writes its own file, so disk writes overlap too
+            for _ in pool.map(save, sorted_articles):
+                pass
+            save_json_cache(manifest_path, manifest)
 
     # Generate index page
     index_html = _generate_index(sorted_articles, blog_title)
-    (html_dir / "index.html").write_text(index_html, encoding="utf-8")
+    _write_file(html_dir / "index.html", index_html, out_zip)
 
     console.print(f"[green]HTML export complete: {html_dir}[/green]")
     return html_dir
 
 
+def _write_file(path: Path, text: str, out_zip: zipfile.ZipFile | None) -> None:
+    """Write text to disk, or into the archive under the same relative path."""
+    if out_zip is not None:
+        out_zip.writestr(path.as_posix(), text.encode("utf-8"))
+    else:
+        path.write_text(text, encoding="utf-8")
+
+
+def _export_digest(base_url: str, slug_index: dict[str, str], image_map: dict[str, Path] | None) -> bytes:
+    """Digest of the inputs every page of one export shares."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{__version__}\0{_PAGE_TEMPLATE}\0{base_url}\0".encode())
+    h.update("\0".join(sorted(f"{path}\0{slug}" for path, slug in slug_index.items())).encode())
+    if image_map:
+        h.update("\0".join(sorted(f"{url}\0{path.name}" for url, path in image_map.items())).encode())
+    return h.digest()
+
+
+def _page_key(article: Article, export_digest: bytes) -> str:
+    """Key of everything that goes into an article's page."""
+    date = article.date.isoformat() if article.date else ""
+    h = hashlib.blake2b(export_digest, digest_size=16)
+    h.update("\0".join((article.title, article.author, date, article.content_html)).encode())
+    return h.hexdigest()
+
+
 def _generate_index(articles: list[Article], blog_title: str) -> str:
     """Generate the index.html table of contents."""
     toc_items = []
     for article in articles:
-        date_str = article.date.strftime("%Y-%m-%d") if article.date else ""
-        date_span = f' <span class="date">({date_str})</span>' if date_str else ""
+        date_span = f' <span class="date">({article.date:%Y-%m-%d})</span>' if article.date else ""
         toc_items.append(
-            f'<li><a href="{article.slug}.html">{article.title}</a>{date_span}</li>'
+            f'<li><a href="{escape(article.slug)}.html">{escape(article.title)}</a>{date_span}</li>'
         )
 
     toc_html = "\n".join(toc_items)
+    blog_title = escape(blog_title)
 
     return f"""<!DOCTYPE html>
 <html lang="en">
@@ -91,25 +178,7 @@ def _generate_index(articles: list[Article], blog_title: str) -> str:
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{blog_title}</title>
     <style>
-{READER_CSS}
-ul {{
-    list-style: none;
-    padding: 0;
-}}
-li {{
-    padding: 0.5rem 0;
-    border-bottom: 1px solid #eee;
-}}
-li a {{
-    text-decoration: none;
-}}
-li a:hover {{
-    text-decoration: underline;
-}}
-.date {{
-    color: #666;
-    font-size: 0.85rem;
-}}
+{_INDEX_CSS}
     </style>
 </head>
 <body>
@@ -1,16 +1,21 @@
 """Export blog to PDF format."""
 
+import re
+import zipfile
 from pathlib import Path
 from datetime import datetime
 
 from rich.console import Console
 
 from ..platforms.base import Article
-from ..cleaner import clean_html, READER_CSS
-from ..linker import rewrite_links, get_all_slugs
+from ..cleaner import READER_CSS
+from ..linker import get_slug_index
+from .content import date_sort_key, get_cleaned
 
 console = Console()
 
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
 
 def export_pdf(
     articles: list[Article],
@@ -19,6 +24,7 @@ def export_pdf(
     image_map: dict[str, Path] | None = None,
     blog_title: str = "Blog Archive",
     blog_author: str = "Unknown",
+    out_zip: zipfile.ZipFile | None = None,
 ) -> Path:
     """
     Export articles to PDF format.
@@ -30,9 +36,11 @@ def export_pdf(
         image_map: Dict mapping image URLs to local paths
         blog_title: PDF title
         blog_author: PDF author
+        out_zip: Stream the PDF into this archive instead of writing to output_dir
 
     Returns:
-        Path to the generated PDF file
+        Path to the generated PDF file (relative to the archive root when
+        out_zip is given)
     """
     try:
         from weasyprint import HTML, CSS
@@ -53,10 +61,12 @@ def export_pdf(
     # Sort articles by date (oldest first)
     sorted_articles = sorted(
         articles,
-        key=lambda a: a.date or datetime.min,
+        key=date_sort_key,
     )
 
-    post_slugs = get_all_slugs(articles)
+    slug_index = get_slug_index(articles)
+    # For PDF, images are referenced by absolute file:// URLs
+    images_uri = (output_dir / "html" / "images").absolute().as_uri()
 
     # Build combined HTML document
     articles_html = []
@@ -90,18 +100,7 @@ def export_pdf(
     for article in sorted_articles:
         date_str = article.date.strftime("%B %d, %Y") if article.date else ""
 
-        content = clean_html(article.content_html)
-        content = rewrite_links(content, base_url, post_slugs, image_map)
-
-        # For PDF, convert relative image paths to absolute file:// URLs
-        if image_map:
-            images_dir = output_dir / "html" / "images"
-            for url, local_path in image_map.items():
-                abs_path = (images_dir / local_path.name).absolute()
-                content = content.replace(
-                    f'src="images/{local_path.name}"',
-                    f'src="file:///{abs_path}"'
-                )
+        content = get_cleaned(article, base_url, slug_index, image_map, relative_image_path=images_uri)
 
         articles_html.append(f"""
 <article id="{article.slug}">
@@ -168,13 +167,21 @@ article:first-of-type {
 """
 
     # Generate PDF
-    output_dir.mkdir(parents=True, exist_ok=True)
-    pdf_path = output_dir / f"{_slugify(blog_title)}.pdf"
+    pdf_name = f"{_slugify(blog_title)}.pdf"
 
     try:
         html = HTML(string=full_html)
         css = CSS(string=pdf_css)
-        html.write_pdf(str(pdf_path), stylesheets=[css])
+        if out_zip is not None:
+            # Render the whole PDF before adding it, so a failure at any stage
+            # leaves no truncated entry (zip members can't be removed)
+            pdf_bytes = html.write_pdf(stylesheets=[css])
+            pdf_path = Path(pdf_name)
+            out_zip.writestr(pdf_name, pdf_bytes)
+        else:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            pdf_path = output_dir / pdf_name
+            html.write_pdf(str(pdf_path), stylesheets=[css])
         console.print(f"[green]PDF export complete: {pdf_path}[/green]")
         return pdf_path
     except OSError as e:
@@ -191,8 +198,7 @@ article:first-of-type {
 
 def _slugify(text: str) -> str:
     """Convert text to a safe filename."""
-    import re
     text = text.lower()
-    text = re.sub(r"[^a-z0-9]+", "-", text)
+    text = _SLUG_RE.sub("-", text)
     text = text.strip("-")
     return text or "book"
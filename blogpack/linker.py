@@ -1,16 +1,24 @@
 """Rewrite links to work locally between downloaded posts."""
 
 import re
+from html import unescape
 from pathlib import Path
-from urllib.parse import urlparse, urljoin
+from urllib.parse import urlparse, urlsplit, urljoin
 
-from bs4 import BeautifulSoup
+from lxml import html as lxml_html
+
+from .platforms.base import _html_parser, _url_path
+
+# Double-quoted href and src (or data-src) values, the form lxml serializes
+# attributes in
+_HREF_VALUE_RE = re.compile(r'href="([^"]*)"')
+_SRC_VALUE_RE = re.compile(r'src="([^"]*)"')
 
 
 def rewrite_links(
     html: str,
     base_url: str,
-    post_slugs: set[str],
+    slug_index: dict[str, str],
     image_map: dict[str, Path] | None = None,
     relative_image_path: str = "images",
 ) -> str:
@@ -20,46 +28,116 @@ def rewrite_links(
     Args:
         html: The HTML content to process
         base_url: The blog's base URL (e.g., "https://www.cold-takes.com/")
-        post_slugs: Set of all known post slugs
+        slug_index: Dict mapping link paths to post slugs (see get_slug_index)
         image_map: Optional dict mapping image URLs to local paths
         relative_image_path: Relative path to images folder
 
     Returns:
-        HTML with rewritten links
+        HTML with rewritten links, or the input unchanged if nothing in it
+        needed rewriting
     """
-    soup = BeautifulSoup(html, "lxml")
-    base_parsed = urlparse(base_url)
-    base_domain = base_parsed.netloc
+    if not html.strip():
+        return ""
 
-    # Rewrite anchor links
-    for a in soup.find_all("a", href=True):
-        href = a["href"]
-        parsed = urlparse(href)
+    # Hosts are case-insensitive
+    base_domain = urlsplit(base_url).netloc.lower()
+    if not _needs_rewrite(html, base_domain, slug_index, image_map):
+        return html
 
-        # Check if this is an internal link to the same domain
-        if parsed.netloc == "" or parsed.netloc == base_domain:
-            # Extract the path
-            path = parsed.path.strip("/")
+    tree = lxml_html.document_fromstring(html, parser=_html_parser())
 
-            # Check if this path matches a known post slug
-            if path in post_slugs:
-                a["href"] = f"{path}.html"
+    # Rewrite anchor links
+    for a in tree.iter("a"):
+        href = a.get("href")
+        if href is None:
+            continue
+
+        # Check if this path leads to a known post
+        path = _internal_path(href, base_domain)
+        if path is not None and path in slug_index:
+            a.set("href", f"{slug_index[path]}.html")
 
     # Rewrite image sources
     if image_map:
-        for img in soup.find_all("img"):
+        for img in tree.iter("img"):
             src = img.get("src") or img.get("data-src")
             if src and src in image_map:
                 local_path = image_map[src]
-                img["src"] = f"{relative_image_path}/{local_path.name}"
-                if "data-src" in img.attrs:
-                    del img["data-src"]
+                img.set("src", f"{relative_image_path}/{local_path.name}")
+                img.attrib.pop("data-src", None)
+
+    # Extract just the body content (lxml adds html/body wrapper). Serialize
+    # the body in one call and slice off its own tags
+    body = tree.find("body")
+    if body is None:
+        return lxml_html.tostring(tree, encoding="unicode", method="html")
+    body.attrib.clear()
+    serialized = lxml_html.tostring(body, encoding="unicode", method="html", with_tail=False)
+    return serialized[len("<body>"):-len("</body>")]
+
+
+def _needs_rewrite(
+    html: str,
+    base_domain: str,
+    slug_index: dict[str, str],
+    image_map: dict[str, Path] | None,
+) -> bool:
+    """Whether rewrite_links would change anything, from a scan of the raw markup.
+
+    Much cheaper than parsing, and exact for markup lxml serialized (such as
+    clean_html output). If any "href" or "src" in the text isn't in the plain
+    attr="value" form (other quoting, spacing or case), answers True and
+    leaves it to the parser.
+    """
+    lowered = html.lower()
+    if (
+        lowered.count("href") != html.count('href="')
+        or lowered.count("src") != html.count('src="') + html.count("srcset=")
+    ):
+        return True
 
-    # Extract just the body content (lxml adds html/body wrapper)
-    body = soup.find("body")
-    if body:
-        return "".join(str(child) for child in body.children)
-    return str(soup)
+    for value in _HREF_VALUE_RE.findall(html):
+        if "&" in value:
+            value = unescape(value)
+        path = _internal_path(value, base_domain)
+        if path is not None and path in slug_index:
+            return True
+
+    if image_map:
+        for value in _SRC_VALUE_RE.findall(html):
+            if "&" in value:
+                value = unescape(value)
+            if value in image_map:
+                return True
+    return False
+
+
+def _internal_path(href: str, base_domain: str) -> str | None:
+    """Return urlsplit(href).path.strip("/") for same-domain links, else None.
+
+    base_domain must be lowercase.
+
+    Relative hrefs and absolute http(s) links to base_domain are sliced
+    directly; anything else (other domains, odd schemes, surrounding or
+    embedded whitespace) goes through urlsplit.
+    """
+    if href[:1] > " " and "\t" not in href and "\n" not in href and "\r" not in href:
+        if ":" not in href and not href.startswith("//"):
+            return href.partition("#")[0].partition("?")[0].strip("/")
+        if href.startswith(("https://", "http://")):
+            rest = href[href.index("//") + 2:]
+            if rest[:len(base_domain)].lower() == base_domain:
+                after = rest[len(base_domain):]
+                if after[:1] in ("", "/", "?", "#"):
+                    return after.partition("#")[0].partition("?")[0].strip("/")
+            if rest[:1] not in ("", "/", "?", "#"):
+                return None  # A netloc other than base_domain
+
+    parsed = urlsplit(href)
+    # Internal links are relative or on the blog's own domain
+    if parsed.netloc == "" or parsed.netloc.lower() == base_domain:
+        return parsed.path.strip("/")
+    return None
 
 
 def extract_slug_from_url(url: str, base_url: str) -> str:
@@ -69,6 +147,15 @@ def extract_slug_from_url(url: str, base_url: str) -> str:
     return path if path else "index"
 
 
-def get_all_slugs(articles) -> set[str]:
-    """Get set of all post slugs from articles."""
-    return {article.slug for article in articles}
+def get_slug_index(articles) -> dict[str, str]:
+    """
+    Map every path that links to a post onto the slug its page is saved as.
+
+    Built once per export and shared by every rewrite_links call. Slugs
+    don't always match URL paths (Substack drops the "p/" prefix, WordPress
+    keeps only the last segment), so each post is keyed by its URL path as
+    well as by its slug.
+    """
+    index = {article.slug: article.slug for article in articles}
+    index.update((_url_path(article.url), article.slug) for article in articles)
+    return index
@@ -1,11 +1,34 @@
 """Base class for blog platform support."""
 
+import re
+import sys
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime
 from abc import ABC, abstractmethod
+from urllib.parse import urlparse
 
+from lxml import etree
+from lxml import html as lxml_html
 
-@dataclass
+# Parses ISO 8601 timestamps, including a trailing "Z"; raises ValueError on bad input
+try:
+    from ciso8601 import parse_datetime as _parse_iso_datetime
+except ImportError:
+    if sys.version_info >= (3, 11):
+        _parse_iso_datetime = datetime.fromisoformat
+    else:
+        def _parse_iso_datetime(value: str) -> datetime:
+            return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+# orjson's JSONDecodeError subclasses json's, so callers catch json.JSONDecodeError either way
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+
+@dataclass(slots=True)
 class Article:
     """Represents a parsed blog article."""
     url: str
@@ -17,7 +40,7 @@ class Article:
     image_urls: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class PostInfo:
     """Basic info about a post from sitemap/index."""
     url: str
@@ -25,6 +48,77 @@ class PostInfo:
     last_modified: datetime | None = None
 
 
+def _prepare_indicators(indicators: list[str]) -> tuple[str, ...]:
+    """Prepare literal detection strings for a lowercased page.
+
+    An indicator that contains another one is redundant (wherever it
+    matches, so does the shorter one), so it is dropped. Lowercasing the
+    page once and testing each indicator with `in` is several times faster
+    than one case-insensitive regex alternation, which CPython's re engine
+    tries at every offset.
+    """
+    unique = list(dict.fromkeys(indicator.lower() for indicator in indicators))
+    return tuple(
+        indicator for indicator in unique
+        if not any(other != indicator and other in indicator for other in unique)
+    )
+
+
+def _url_path(url: str) -> str:
+    """Return urlparse(url).path.strip("/"), slicing plain http(s) URLs directly.
+
+    Slugs are derived for every sitemap entry, so the common case skips
+    urlparse; anything unusual (params, embedded whitespace) still goes
+    through it.
+    """
+    if not url.startswith(("https://", "http://")) or ";" in url or "\t" in url or "\n" in url or "\r" in url:
+        return urlparse(url).path.strip("/")
+    url = url.partition("#")[0].partition("?")[0]
+    start = url.find("/", url.index("//") + 2)
+    return url[start:].strip("/") if start >= 0 else ""
+
+
+_XML_DECLARATION_RE = re.compile(r"^\s*<\?xml[^>]*\?>")
+
+# One reusable parser per thread (lxml parsers can't be shared across threads).
+# huge_tree: without it libxml2 silently drops everything after a text node
+# or attribute over 10 MB, such as a large inline data: image
+_PARSER_LOCAL = threading.local()
+
+
+def _html_parser() -> lxml_html.HTMLParser:
+    """Return this thread's HTML parser."""
+    parser = getattr(_PARSER_LOCAL, "parser", None)
+    if parser is None:
+        parser = _PARSER_LOCAL.parser = lxml_html.HTMLParser(recover=True, huge_tree=True)
+    return parser
+
+
+def _parse_html(html: str):
+    """Parse a post page into an lxml document, tolerating empty pages."""
+    # lxml refuses str input that still carries an encoding declaration
+    html = _XML_DECLARATION_RE.sub("", html, count=1)
+    parser = _html_parser()
+    try:
+        return lxml_html.document_fromstring(html, parser=parser)
+    except etree.ParserError:
+        return lxml_html.document_fromstring("<html></html>", parser=parser)
+
+
+def _has_class(name: str) -> str:
+    """XPath predicate matching elements whose class list contains name (CSS .name)."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def _first(xpaths, tree):
+    """Return the first match of the first XPath in xpaths that matches."""
+    for xpath in xpaths:
+        found = xpath(tree)
+        if found:
+            return found[0]
+    return None
+
+
 class BlogPlatform(ABC):
     """Base class for blog platform support."""
 
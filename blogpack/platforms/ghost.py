@@ -1,11 +1,73 @@
 """Ghost blog platform support."""
 
-import re
 from datetime import datetime
-from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup
-
-from .base import BlogPlatform, Article, PostInfo
+from io import BytesIO
+from html import escape
+from urllib.parse import urljoin
+
+from lxml import etree
+from lxml import html as lxml_html
+
+from .base import (
+    BlogPlatform, Article, PostInfo,
+    _first, _has_class, _parse_html, _parse_iso_datetime, _prepare_indicators, _url_path,
+)
+
+
+# Compiled once; each list is tried in order and the first match wins, like
+# BeautifulSoup's select_one over a list of CSS selectors
+_TITLE_XPATHS = tuple(etree.XPath(x) for x in (
+    f"//h1[{_has_class('post-full-title')}]",
+    f"//h1[{_has_class('article-title')}]",
+    f"//h1[{_has_class('post-title')}]",
+    "//article//h1",
+    "//h1",
+))
+_OG_TITLE_XPATH = etree.XPath("//meta[@property='og:title']")
+_TITLE_TAG_XPATH = etree.XPath("//title")
+
+_AUTHOR_META_XPATH = etree.XPath("//meta[@name='author']/@content")
+_TWITTER_CREATOR_XPATH = etree.XPath("//meta[@name='twitter:creator']/@content")
+_AUTHOR_LINK_XPATH = etree.XPath("//a[@title][contains(@href, '/about')]/@title")
+_REL_AUTHOR_XPATH = etree.XPath("//*[@rel='author']")
+_BYLINE_XPATH = etree.XPath(
+    f"//*[{_has_class('byline-name')} or {_has_class('author-name')}"
+    f" or {_has_class('post-full-byline-content')}]"
+)
+
+_TIME_XPATH = etree.XPath("//time/@datetime")
+_PUBLISHED_META_XPATH = etree.XPath("//meta[@property='article:published_time']/@content")
+
+_CONTENT_XPATHS = tuple(etree.XPath(x) for x in (
+    f"//div[{_has_class('single-content')}]",  # Cold Takes theme
+    f"//div[{_has_class('gh-content')}]",
+    f"//section[{_has_class('post-full-content')}]//*[{_has_class('post-content')}]",
+    f"//section[{_has_class('post-full-content')}]",
+    f"//div[{_has_class('post-content')}]",
+    f"//article//*[{_has_class('post-content')}]",
+    f"//article//*[{_has_class('content')}]",
+))
+_ARTICLE_XPATH = etree.XPath("//article")
+# Elements stripped from the content; checked with set lookups in one walk,
+# which is much cheaper than an XPath class predicate per name per element
+_UNWANTED_TAGS = frozenset({"script", "style", "nav", "header", "footer"})
+_UNWANTED_CLASSES = frozenset({
+    "subscribe-form", "post-full-byline", "post-full-meta", "kg-signup-card",
+    "related-posts", "comments", "share-buttons", "social-links", "post-full-header",
+})
+# Each <img>'s src, or its data-src when src is missing or empty
+_IMG_SRC_XPATH = etree.XPath(
+    "//img/@src[. != ''] | //img[not(@src != '')]/@data-src[. != '']",
+    smart_strings=False,
+)
+
+# Footer text or meta tags
+_DETECT_INDICATORS = _prepare_indicators([
+    "powered by ghost",
+    'content="ghost"',
+    "ghost.org",
+    'generator" content="ghost',
+])
 
 
 class GhostPlatform(BlogPlatform):
@@ -16,13 +78,7 @@ class GhostPlatform(BlogPlatform):
     def detect(self, html: str) -> bool:
         """Detect Ghost blogs by footer text or meta tags."""
         html_lower = html.lower()
-        indicators = [
-            "powered by ghost",
-            'content="ghost"',
-            "ghost.org",
-            'generator" content="ghost',
-        ]
-        return any(indicator in html_lower for indicator in indicators)
+        return any(indicator in html_lower for indicator in _DETECT_INDICATORS)
 
     async def get_post_urls(self, base_url: str, client) -> list[PostInfo]:
         """Fetch post URLs from Ghost's sitemap-posts.xml."""
@@ -30,52 +86,66 @@ class GhostPlatform(BlogPlatform):
         response = await client.get(sitemap_url)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, "lxml-xml")
+        # Stream <url> entries and free each one once read, so memory stays
+        # flat however large the sitemap is
         posts = []
-
-        for url_elem in soup.find_all("url"):
-            loc = url_elem.find("loc")
-            lastmod = url_elem.find("lastmod")
-
-            if loc:
-                url = loc.text.strip()
-                slug = self._url_to_slug(url, base_url)
-
-                modified = None
-                if lastmod:
-                    try:
-                        modified = datetime.fromisoformat(lastmod.text.strip().replace("Z", "+00:00"))
-                    except ValueError:
-                        pass
-
-                posts.append(PostInfo(url=url, slug=slug, last_modified=modified))
+        entries = etree.iterparse(
+            BytesIO(response.content),
+            events=("end",),
+            tag="{*}url",
+            recover=True,
+            resolve_entities=False,
+            no_network=True,
+        )
+        try:
+            for _, url_elem in entries:
+                loc = url_elem.findtext("{*}loc")
+                lastmod = url_elem.findtext("{*}lastmod")
+
+                if loc:
+                    url = loc.strip()
+                    slug = self._url_to_slug(url, base_url)
+
+                    modified = None
+                    if lastmod:
+                        try:
+                            modified = _parse_iso_datetime(lastmod.strip())
+                        except ValueError:
+                            pass
+
+                    posts.append(PostInfo(url=url, slug=slug, last_modified=modified))
+
+                url_elem.clear()
+                while url_elem.getprevious() is not None:
+                    del url_elem.getparent()[0]
+        except etree.XMLSyntaxError:
+            pass  # Keep whatever was read before the sitemap broke off
 
         return posts
 
     def _url_to_slug(self, url: str, base_url: str) -> str:
         """Extract slug from URL."""
-        parsed = urlparse(url)
-        path = parsed.path.strip("/")
+        path = _url_path(url)
         return path if path else "index"
 
     def extract_article(self, html: str, url: str) -> Article:
         """Extract clean article content from Ghost post HTML."""
-        soup = BeautifulSoup(html, "lxml")
+        tree = _parse_html(html)
 
         # Extract title
-        title = self._extract_title(soup)
+        title = self._extract_title(tree)
 
         # Extract author
-        author = self._extract_author(soup)
+        author = self._extract_author(tree)
 
         # Extract date
-        date = self._extract_date(soup)
+        date = self._extract_date(tree)
 
         # Extract main content
-        content_html = self._extract_content(soup)
+        content_html = self._extract_content(tree)
 
-        # Extract image URLs from content
-        image_urls = self._extract_images(soup, url)
+        # Extract image URLs (after content extraction has pruned unwanted elements)
+        image_urls = self._extract_images(tree, url)
 
         slug = self._url_to_slug(url, "")
 
@@ -89,131 +159,103 @@ class GhostPlatform(BlogPlatform):
             image_urls=image_urls,
         )
 
-    def _extract_title(self, soup: BeautifulSoup) -> str:
+    def _extract_title(self, tree) -> str:
         """Extract article title."""
-        # Try various selectors
-        selectors = [
-            "h1.post-full-title",
-            "h1.article-title",
-            "h1.post-title",
-            "article h1",
-            "h1",
-        ]
-        for selector in selectors:
-            elem = soup.select_one(selector)
-            if elem:
-                return elem.get_text(strip=True)
+        elem = _first(_TITLE_XPATHS, tree)
+        if elem is not None:
+            return elem.text_content().strip()
 
         # Fallback to og:title or title tag
-        og_title = soup.find("meta", property="og:title")
+        og_title = _OG_TITLE_XPATH(tree)
         if og_title:
-            return og_title.get("content", "Untitled")
+            return og_title[0].get("content", "Untitled")
 
-        title_tag = soup.find("title")
+        title_tag = _TITLE_TAG_XPATH(tree)
         if title_tag:
-            return title_tag.get_text(strip=True).split("|")[0].strip()
+            return title_tag[0].text_content().strip().split("|")[0].strip()
 
         return "Untitled"
 
-    def _extract_author(self, soup: BeautifulSoup) -> str:
+    def _extract_author(self, tree) -> str:
         """Extract article author."""
         # Try meta tag first
-        author_meta = soup.find("meta", {"name": "author"})
-        if author_meta and author_meta.get("content"):
-            return author_meta.get("content")
+        for author in _AUTHOR_META_XPATH(tree):
+            if author:
+                return author
 
         # Try twitter:creator
-        twitter_author = soup.find("meta", {"name": "twitter:creator"})
-        if twitter_author and twitter_author.get("content"):
-            return twitter_author.get("content").lstrip("@")
+        for author in _TWITTER_CREATOR_XPATH(tree):
+            if author:
+                return author.lstrip("@")
 
         # Try link with title attribute (common in Ghost themes)
-        author_link = soup.select_one('a[title][href*="/about"]')
-        if author_link and author_link.get("title"):
-            return author_link.get("title")
+        author_link = _AUTHOR_LINK_XPATH(tree)
+        if author_link and author_link[0]:
+            return author_link[0]
 
         # Try schema.org author
-        author_elem = soup.select_one('[rel="author"]')
+        author_elem = _REL_AUTHOR_XPATH(tree)
         if author_elem:
-            return author_elem.get_text(strip=True)
+            return author_elem[0].text_content().strip()
 
         # Try byline class
-        byline = soup.select_one(".byline-name, .author-name, .post-full-byline-content")
+        byline = _BYLINE_XPATH(tree)
         if byline:
-            return byline.get_text(strip=True)
+            return byline[0].text_content().strip()
 
         return "Unknown"
 
-    def _extract_date(self, soup: BeautifulSoup) -> datetime | None:
+    def _extract_date(self, tree) -> datetime | None:
         """Extract publication date."""
-        # Try time element
-        time_elem = soup.find("time", datetime=True)
-        if time_elem:
-            try:
-                return datetime.fromisoformat(time_elem["datetime"].replace("Z", "+00:00"))
-            except ValueError:
-                pass
-
-        # Try meta tag
-        date_meta = soup.find("meta", property="article:published_time")
-        if date_meta:
-            try:
-                return datetime.fromisoformat(date_meta["content"].replace("Z", "+00:00"))
-            except ValueError:
-                pass
+        # Try time element, then meta tag
+        for xpath in (_TIME_XPATH, _PUBLISHED_META_XPATH):
+            found = xpath(tree)
+            if found:
+                try:
+                    return _parse_iso_datetime(found[0])
+                except ValueError:
+                    pass
 
         return None
 
-    def _extract_content(self, soup: BeautifulSoup) -> str:
+    def _extract_content(self, tree) -> str:
         """Extract main article content HTML."""
         # Try various content selectors - prefer more specific ones first
-        selectors = [
-            "div.single-content",  # Cold Takes theme
-            "div.gh-content",
-            "section.post-full-content .post-content",
-            "section.post-full-content",
-            "div.post-content",
-            "article .post-content",
-            "article .content",
-        ]
+        content_elem = _first(_CONTENT_XPATHS, tree)
 
-        content_elem = None
-        for selector in selectors:
-            content_elem = soup.select_one(selector)
-            if content_elem:
-                break
-
-        # Fallback: try to find main content area but exclude header/byline
-        if not content_elem:
-            article = soup.select_one("article")
+        # Fallback: the whole article element
+        if content_elem is None:
+            article = _ARTICLE_XPATH(tree)
             if article:
-                # Clone and remove header/byline from the clone
-                content_elem = article
+                content_elem = article[0]
             else:
                 return "<p>Content could not be extracted.</p>"
 
-        # Remove unwanted elements
-        for unwanted in content_elem.select(
-            "script, style, nav, header, footer, .subscribe-form, "
-            ".post-full-byline, .post-full-meta, .kg-signup-card, .related-posts, "
-            ".comments, .share-buttons, .social-links, .post-full-header"
-        ):
-            unwanted.decompose()
+        # Remove unwanted elements (drop_tree keeps the text that follows them).
+        # Collect first: the tree can't be changed while it is being iterated
+        unwanted = [
+            el for el in content_elem.iterdescendants(etree.Element)
+            if el.tag in _UNWANTED_TAGS or not _UNWANTED_CLASSES.isdisjoint((el.get("class") or "").split())
+        ]
+        for el in unwanted:
+            el.drop_tree()
 
         # Get inner HTML (children only, not the wrapper element)
-        inner_html = "".join(str(child) for child in content_elem.children)
-        return inner_html if inner_html.strip() else str(content_elem)
+        inner_html = (escape(content_elem.text, quote=False) if content_elem.text else "") + "".join(
+            lxml_html.tostring(child, encoding="unicode", method="html") for child in content_elem
+        )
+        if inner_html.strip():
+            return inner_html
+        return lxml_html.tostring(content_elem, encoding="unicode", method="html", with_tail=False)
 
-    def _extract_images(self, soup: BeautifulSoup, base_url: str) -> list[str]:
+    def _extract_images(self, tree, base_url: str) -> list[str]:
         """Extract all image URLs from the article."""
         images = []
-        for img in soup.find_all("img"):
-            src = img.get("src") or img.get("data-src")
-            if src:
-                # Skip data URLs and blob URLs
-                if src.startswith(("data:", "blob:")):
-                    continue
-                # Make absolute URL
-                absolute_url = urljoin(base_url, src)
-                images.append(absolute_url)
+        for src in _IMG_SRC_XPATH(tree):
+            # Skip data URLs and blob URLs
+            if src.startswith(("data:", "blob:")):
+                continue
+            # Make absolute URL
+            absolute_url = urljoin(base_url, src)
+            images.append(absolute_url)
         return images
@@ -0,0 +1,62 @@
+"""Streaming sitemap parsing shared by the platforms."""
+
+from lxml import etree
+
+_NS = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+_URL_TAG = f"{_NS}url"
+_SITEMAP_TAG = f"{_NS}sitemap"
+_LOC_TAG = f"{_NS}loc"
+_LASTMOD_TAG = f"{_NS}lastmod"
+
+
+async def fetch_sitemap(client, url: str) -> tuple[list[str], list[tuple[str, str | None]]] | None:
+    """
+    Fetch a sitemap or sitemap index, parsing it as the bytes arrive.
+
+    Each entry is freed once read, so memory stays at about one entry however
+    large the sitemap is. A sitemap that breaks off partway still yields the
+    entries read before the break.
+
+    Returns:
+        (sub-sitemap URLs, [(loc, lastmod)] of page entries), or None if the
+        request was not successful
+    """
+    parser = etree.XMLPullParser(
+        events=("end",),
+        tag=(_URL_TAG, _SITEMAP_TAG),
+        recover=True,
+        huge_tree=True,
+        resolve_entities=False,
+        no_network=True,
+    )
+    refs: list[str] = []
+    entries: list[tuple[str, str | None]] = []
+
+    async with client.stream("GET", url) as response:
+        if not response.is_success:
+            return None
+        try:
+            async for chunk in response.aiter_bytes():
+                parser.feed(chunk)
+                _read_entries(parser, refs, entries)
+            parser.close()
+        except etree.XMLSyntaxError:
+            pass
+    _read_entries(parser, refs, entries)
+    return refs, entries
+
+
+def _read_entries(parser: etree.XMLPullParser, refs: list[str], entries: list[tuple[str, str | None]]):
+    """Collect the entries parsed so far and free them."""
+    for _, elem in parser.read_events():
+        loc = (elem.findtext(_LOC_TAG) or "").strip()
+        if loc:
+            if elem.tag == _SITEMAP_TAG:
+                refs.append(loc)
+            else:
+                entries.append((loc, elem.findtext(_LASTMOD_TAG)))
+        elem.clear()
+        parent = elem.getparent()
+        if parent is not None:
+            while elem.getprevious() is not None:
+                del parent[0]
@@ -1,14 +1,82 @@
 """Substack blog platform support."""
 
+import asyncio
 import json
 import re
 from datetime import datetime
-from urllib.parse import urljoin, urlparse
-from xml.etree import ElementTree as ET
-
-from bs4 import BeautifulSoup
-
-from .base import BlogPlatform, Article, PostInfo
+from urllib.parse import urljoin
+
+from lxml import etree
+from lxml import html as lxml_html
+
+from .base import (
+    BlogPlatform, Article, PostInfo,
+    _first, _has_class, _json_loads, _parse_html, _parse_iso_datetime, _prepare_indicators, _url_path,
+)
+from .sitemap import fetch_sitemap
+
+_DETECT_INDICATORS = _prepare_indicators([
+    "substack.com",
+    "substackcdn.com",
+    'content="substack"',
+    "substack-post",
+    "substack.com/app",
+])
+
+
+# Shared by every feed parse; recovers from the malformed XML some
+# blogs serve, and never fetches external entities
+_XML_PARSER = etree.XMLParser(recover=True, huge_tree=True, resolve_entities=False, no_network=True)
+_FEED_LINK_XPATH = etree.XPath(".//item/link[1]/text()")
+
+# Post page lookups, compiled once rather than per article. Lists are tried
+# in order and the first match wins
+_PAYWALL_TITLE_XPATH = etree.XPath(f"//h2[{_has_class('paywall-title')}]")
+_PAYWALL_DIV_XPATH = etree.XPath(f"//div[{_has_class('paywall')}]")
+_AVAILABLE_CONTENT_XPATH = etree.XPath(f"//div[{_has_class('available-content')}]")
+_JSON_LD_XPATH = etree.XPath("//script[@type='application/ld+json']")
+_JSON_LD_TYPES = ("Article", "NewsArticle", "BlogPosting")
+# "Subscribe to continue" type messages in the content area
+_PAYWALL_INDICATORS = (
+    "subscribe to continue",
+    "this post is for paid subscribers",
+    "upgrade to paid",
+    "become a paid subscriber",
+)
+
+_TITLE_XPATHS = tuple(etree.XPath(x) for x in (
+    f"//h1[{_has_class('post-title')}]",
+    f"//h2[{_has_class('post-title')}]",
+    "//h1",
+))
+_OG_TITLE_XPATH = etree.XPath("//meta[@property='og:title']")
+_SUBTITLE_XPATH = etree.XPath(f"//h3[{_has_class('subtitle')}]")
+_AUTHOR_META_XPATH = etree.XPath("//meta[@name='author']")
+_AUTHOR_LINK_XPATH = etree.XPath(
+    f"//a[{_has_class('frontend-pencraft-Text-module__decoration-hover-underline--BEYAn')}]"
+)
+_TIME_XPATH = etree.XPath("//time[@datetime]/@datetime")
+
+_CONTENT_XPATHS = tuple(etree.XPath(x) for x in (
+    f"//div[{_has_class('available-content')}]",
+    f"//div[{_has_class('body')}]",
+    "//article",
+))
+# Elements stripped from the content, found in one walk with set lookups
+_UNWANTED_TAGS = frozenset({"script", "style", "button"})
+_UNWANTED_CLASSES = frozenset({
+    "subscription-widget", "subscribe-widget", "post-ufi", "post-footer",
+    "comments-section", "share-dialog",
+    # Interactive UI buttons (refresh, expand, etc.)
+    "button-wrap", "captioned-button-wrap", "image-link-expand",
+    "tweet-link-top", "tweet-link-bottom", "tweet-header",
+})
+_SKIPPED_URL_PREFIXES = ("data:", "blob:")
+# Each <img>'s src, or its data-src when src is missing or empty
+_IMG_SRC_XPATH = etree.XPath(
+    "//img/@src[. != ''] | //img[not(@src != '')]/@data-src[. != '']",
+    smart_strings=False,
+)
 
 
 class SubstackPlatform(BlogPlatform):
@@ -18,18 +86,13 @@ class SubstackPlatform(BlogPlatform):
 
     # URLs containing these keywords are not posts
     FILTER_KEYWORDS = ["about", "archive", "podcast", "subscribe", "recommendations"]
+    # One scan per URL instead of one substring search per keyword
+    _FILTER_RE = re.compile("|".join(map(re.escape, FILTER_KEYWORDS)))
 
     def detect(self, html: str) -> bool:
         """Detect Substack blogs by checking for Substack-specific indicators."""
         html_lower = html.lower()
-        indicators = [
-            "substack.com",
-            "substackcdn.com",
-            'content="substack"',
-            "substack-post",
-            "substack.com/app",
-        ]
-        return any(indicator in html_lower for indicator in indicators)
+        return any(indicator in html_lower for indicator in _DETECT_INDICATORS)
 
     async def get_post_urls(self, base_url: str, client) -> list[PostInfo]:
         """Fetch post URLs from Substack's sitemap.xml, fallback to feed.xml."""
@@ -42,55 +105,45 @@ class SubstackPlatform(BlogPlatform):
         """Fetch URLs from sitemap.xml."""
         sitemap_url = urljoin(base_url, "/sitemap.xml")
         try:
-            response = await client.get(sitemap_url)
-            if not response.is_success:
+            sitemap = await fetch_sitemap(client, sitemap_url)
+            if sitemap is None:
                 return []
-
-            root = ET.fromstring(response.content)
+            sitemap_refs, entries = sitemap
             posts = []
 
             # Handle both regular sitemaps and sitemap indexes
-            ns = {"sm": "http://www.sitemaps.org/schemas/sitemap/0.9"}
-
-            # Check if this is a sitemap index
-            sitemap_refs = root.findall(".//sm:sitemap/sm:loc", ns)
             if sitemap_refs:
                 # It's a sitemap index - fetch the post sitemap
-                for ref in sitemap_refs:
-                    if "posts" in ref.text.lower():
-                        sub_response = await client.get(ref.text)
-                        if sub_response.is_success:
-                            sub_root = ET.fromstring(sub_response.content)
-                            posts.extend(self._parse_sitemap_urls(sub_root, ns, base_url))
+                # Fetch every post sitemap at once; a failed one is just skipped
+                sub_sitemaps = await asyncio.gather(
+                    *(fetch_sitemap(client, ref) for ref in sitemap_refs if "posts" in ref.lower()),
+                    return_exceptions=True,
+                )
+                for sub_sitemap in sub_sitemaps:
+                    if isinstance(sub_sitemap, tuple):
+                        posts.extend(self._parse_sitemap_urls(sub_sitemap[1]))
             else:
                 # Regular sitemap
-                posts = self._parse_sitemap_urls(root, ns, base_url)
+                posts = self._parse_sitemap_urls(entries)
 
             return posts
         except Exception:
             return []
 
-    def _parse_sitemap_urls(self, root, ns: dict, base_url: str) -> list[PostInfo]:
-        """Parse URLs from a sitemap XML element."""
+    def _parse_sitemap_urls(self, entries: list[tuple[str, str | None]]) -> list[PostInfo]:
+        """Build posts from sitemap (loc, lastmod) entries."""
         posts = []
-        for url_elem in root.findall(".//sm:url", ns):
-            loc = url_elem.find("sm:loc", ns)
-            lastmod = url_elem.find("sm:lastmod", ns)
-
-            if loc is not None and loc.text:
-                url = loc.text.strip()
-                slug = self._url_to_slug(url)
+        for url, lastmod in entries:
+            slug = self._url_to_slug(url)
 
-                modified = None
-                if lastmod is not None and lastmod.text:
-                    try:
-                        modified = datetime.fromisoformat(
-                            lastmod.text.strip().replace("Z", "+00:00")
-                        )
-                    except ValueError:
-                        pass
+            modified = None
+            if lastmod:
+                try:
+                    modified = _parse_iso_datetime(lastmod.strip())
+                except ValueError:
+                    pass
 
-                posts.append(PostInfo(url=url, slug=slug, last_modified=modified))
+            posts.append(PostInfo(url=url, slug=slug, last_modified=modified))
 
         return posts
 
@@ -102,15 +155,13 @@ class SubstackPlatform(BlogPlatform):
             if not response.is_success:
                 return []
 
-            root = ET.fromstring(response.content)
+            root = etree.fromstring(response.content, _XML_PARSER)
             posts = []
 
-            for item in root.findall(".//item"):
-                link = item.find("link")
-                if link is not None and link.text:
-                    url = link.text.strip()
-                    slug = self._url_to_slug(url)
-                    posts.append(PostInfo(url=url, slug=slug))
+            for link in _FEED_LINK_XPATH(root):
+                url = link.strip()
+                if url:
+                    posts.append(PostInfo(url=url, slug=self._url_to_slug(url)))
 
             return posts
         except Exception:
@@ -120,47 +171,46 @@ class SubstackPlatform(BlogPlatform):
         """Filter out non-post URLs."""
         return [
             post for post in posts
-            if all(kw not in post.url.lower() for kw in self.FILTER_KEYWORDS)
-            and "/p/" in post.url  # Substack posts have /p/ in the URL
+            if "/p/" in post.url  # Substack posts have /p/ in the URL
+            and not self._FILTER_RE.search(post.url.lower())
         ]
 
     def _url_to_slug(self, url: str) -> str:
         """Extract slug from URL."""
-        parsed = urlparse(url)
         # Substack URLs are like: https://blog.substack.com/p/post-title
-        path = parsed.path.strip("/")
+        path = _url_path(url)
         if path.startswith("p/"):
             path = path[2:]  # Remove "p/" prefix
         return path if path else "index"
 
     def extract_article(self, html: str, url: str) -> Article | None:
         """Extract article content from Substack post HTML."""
-        soup = BeautifulSoup(html, "lxml")
+        tree = _parse_html(html)
 
         # Check for paywall - skip premium posts
-        if self._is_paywalled(soup):
+        if self._is_paywalled(tree):
             return None
 
         # Extract metadata from JSON-LD first (most reliable)
-        metadata = self._extract_json_ld(soup)
+        metadata = self._extract_json_ld(tree)
 
         # Extract title
-        title = metadata.get("title") or self._extract_title(soup)
+        title = metadata.get("title") or self._extract_title(tree)
 
         # Extract author
-        author = metadata.get("author") or self._extract_author(soup)
+        author = metadata.get("author") or self._extract_author(tree)
 
         # Extract date
-        date = metadata.get("date") or self._extract_date(soup)
+        date = metadata.get("date") or self._extract_date(tree)
 
         # Extract subtitle
-        subtitle = self._extract_subtitle(soup)
+        subtitle = self._extract_subtitle(tree)
 
         # Extract main content
-        content_html = self._extract_content(soup, subtitle)
+        content_html = self._extract_content(tree, subtitle)
 
         # Extract image URLs
-        image_urls = self._extract_images(soup, url)
+        image_urls = self._extract_images(tree, url)
 
         slug = self._url_to_slug(url)
 
@@ -174,50 +224,41 @@ class SubstackPlatform(BlogPlatform):
             image_urls=image_urls,
         )
 
-    def _is_paywalled(self, soup: BeautifulSoup) -> bool:
+    def _is_paywalled(self, tree) -> bool:
         """Check if the post is behind a paywall."""
         # Check for paywall title
-        paywall_title = soup.find("h2", class_="paywall-title")
-        if paywall_title:
+        if _PAYWALL_TITLE_XPATH(tree):
             return True
 
         # Check for paywall div
-        paywall_div = soup.find("div", class_="paywall")
-        if paywall_div:
+        if _PAYWALL_DIV_XPATH(tree):
             return True
 
         # Check for "Subscribe to continue" type messages
-        paywall_indicators = [
-            "subscribe to continue",
-            "this post is for paid subscribers",
-            "upgrade to paid",
-            "become a paid subscriber",
-        ]
-        text_content = soup.get_text().lower()
         # Only check in the content area, not the whole page
-        content_area = soup.find("div", class_="available-content")
+        content_area = _AVAILABLE_CONTENT_XPATH(tree)
         if content_area:
-            content_text = content_area.get_text().lower()
-            if any(indicator in content_text for indicator in paywall_indicators):
+            content_text = content_area[0].text_content().lower()
+            if any(indicator in content_text for indicator in _PAYWALL_INDICATORS):
                 return True
 
         return False
 
-    def _extract_json_ld(self, soup: BeautifulSoup) -> dict:
+    def _extract_json_ld(self, tree) -> dict:
         """Extract metadata from JSON-LD script tag."""
         result = {"title": None, "author": None, "date": None}
 
-        script_tag = soup.find("script", {"type": "application/ld+json"})
-        if not script_tag or not script_tag.string:
+        script_tag = _JSON_LD_XPATH(tree)
+        if not script_tag or not script_tag[0].text:
             return result
 
         try:
-            data = json.loads(script_tag.string)
+            data = _json_loads(script_tag[0].text)
 
             # Handle array of JSON-LD objects
             if isinstance(data, list):
                 for item in data:
-                    if item.get("@type") in ["Article", "NewsArticle", "BlogPosting"]:
+                    if item.get("@type") in _JSON_LD_TYPES:
                         data = item
                         break
                 else:
@@ -239,9 +280,7 @@ class SubstackPlatform(BlogPlatform):
             date_str = data.get("datePublished") or data.get("dateCreated")
             if date_str:
                 try:
-                    result["date"] = datetime.fromisoformat(
-                        date_str.replace("Z", "+00:00")
-                    )
+                    result["date"] = _parse_iso_datetime(date_str)
                 except ValueError:
                     pass
 
@@ -250,105 +289,94 @@ class SubstackPlatform(BlogPlatform):
 
         return result
 
-    def _extract_title(self, soup: BeautifulSoup) -> str:
+    def _extract_title(self, tree) -> str:
         """Extract article title from HTML."""
-        selectors = [
-            "h1.post-title",
-            "h2.post-title",
-            "h1",
-        ]
-        for selector in selectors:
-            elem = soup.select_one(selector)
-            if elem:
-                return elem.get_text(strip=True)
+        elem = _first(_TITLE_XPATHS, tree)
+        if elem is not None:
+            return elem.text_content().strip()
 
         # Fallback to og:title
-        og_title = soup.find("meta", property="og:title")
+        og_title = _OG_TITLE_XPATH(tree)
         if og_title:
-            return og_title.get("content", "Untitled")
+            return og_title[0].get("content", "Untitled")
 
         return "Untitled"
 
-    def _extract_subtitle(self, soup: BeautifulSoup) -> str:
+    def _extract_subtitle(self, tree) -> str:
         """Extract article subtitle."""
-        subtitle_elem = soup.select_one("h3.subtitle")
+        subtitle_elem = _SUBTITLE_XPATH(tree)
         if subtitle_elem:
-            return subtitle_elem.get_text(strip=True)
+            return subtitle_elem[0].text_content().strip()
         return ""
 
-    def _extract_author(self, soup: BeautifulSoup) -> str:
+    def _extract_author(self, tree) -> str:
         """Extract article author."""
         # Try meta tag
-        author_meta = soup.find("meta", {"name": "author"})
-        if author_meta and author_meta.get("content"):
-            return author_meta.get("content")
+        author_meta = _AUTHOR_META_XPATH(tree)
+        if author_meta and author_meta[0].get("content"):
+            return author_meta[0].get("content")
 
         # Try author link
-        author_link = soup.select_one("a.frontend-pencraft-Text-module__decoration-hover-underline--BEYAn")
+        author_link = _AUTHOR_LINK_XPATH(tree)
         if author_link:
-            return author_link.get_text(strip=True)
+            return author_link[0].text_content().strip()
 
         return "Unknown"
 
-    def _extract_date(self, soup: BeautifulSoup) -> datetime | None:
+    def _extract_date(self, tree) -> datetime | None:
         """Extract publication date."""
         # Try time element
-        time_elem = soup.find("time", datetime=True)
-        if time_elem:
+        time_datetime = _TIME_XPATH(tree)
+        if time_datetime:
             try:
-                return datetime.fromisoformat(
-                    time_elem["datetime"].replace("Z", "+00:00")
-                )
+                return _parse_iso_datetime(time_datetime[0])
             except ValueError:
                 pass
 
         return None
 
-    def _extract_content(self, soup: BeautifulSoup, subtitle: str) -> str:
+    def _extract_content(self, tree, subtitle: str) -> str:
         """Extract main article content HTML."""
-        # Substack content is in div.available-content
-        content_elem = soup.select_one("div.available-content")
-
-        if not content_elem:
-            # Fallback selectors
-            content_elem = soup.select_one("div.body")
-            if not content_elem:
-                content_elem = soup.select_one("article")
+        # Substack content is in div.available-content, with fallbacks
+        content_elem = _first(_CONTENT_XPATHS, tree)
 
-        if not content_elem:
+        if content_elem is None:
             return "<p>Content could not be extracted.</p>"
 
-        # Remove unwanted elements
-        for unwanted in content_elem.select(
-            "script, style, .subscription-widget, .subscribe-widget, "
-            ".post-ufi, .post-footer, .comments-section, .share-dialog, "
-            # Remove interactive UI buttons (refresh, expand, etc.)
-            "button, .button-wrap, .captioned-button-wrap, .image-link-expand, "
-            ".tweet-link-top, .tweet-link-bottom, .tweet-header, "
-            "[class*='button'], [class*='Button']"
-        ):
-            unwanted.decompose()
+        # Remove unwanted elements (drop_tree keeps the text that follows them).
+        # Collect first: the tree can't be changed while it is being iterated
+        unwanted = []
+        for el in content_elem.iterdescendants(etree.Element):
+            classes = el.get("class") or ""
+            if (
+                el.tag in _UNWANTED_TAGS
+                or "button" in classes
+                or "Button" in classes
+                or not _UNWANTED_CLASSES.isdisjoint(classes.split())
+            ):
+                unwanted.append(el)
+        for el in unwanted:
+            el.drop_tree()
 
         # Prepend subtitle if present
         content_html = ""
         if subtitle:
             content_html = f"<p><em>{subtitle}</em></p>\n"
 
-        content_html += str(content_elem)
+        content_html += lxml_html.tostring(content_elem, encoding="unicode", method="html", with_tail=False)
         return content_html
 
-    def _extract_images(self, soup: BeautifulSoup, base_url: str) -> list[str]:
+    def _extract_images(self, tree, base_url: str) -> list[str]:
         """Extract all image URLs from the article."""
         images = []
-        for img in soup.find_all("img"):
-            src = img.get("src") or img.get("data-src")
-            if src:
-                # Skip data URLs, tracking pixels, etc.
-                if src.startswith(("data:", "blob:")):
-                    continue
-                if "tracking" in src.lower() or "pixel" in src.lower():
-                    continue
-                # Make absolute URL
-                absolute_url = urljoin(base_url, src)
-                images.append(absolute_url)
+        for src in _IMG_SRC_XPATH(tree):
+            # Skip data URLs, tracking pixels, etc.
+            if src.startswith(_SKIPPED_URL_PREFIXES):
+                continue
+            src_lower = src.lower()
+            if "tracking" in src_lower or "pixel" in src_lower:
+                continue
+            # Make absolute URL
+            absolute_url = urljoin(base_url, src)
+            images.append(absolute_url)
         return images
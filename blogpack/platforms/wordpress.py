@@ -1,13 +1,121 @@
 """WordPress blog platform support."""
 
+import asyncio
+import json
 import re
 from datetime import datetime
-from urllib.parse import urljoin, urlparse
-from xml.etree import ElementTree as ET
-
-from bs4 import BeautifulSoup
-
-from .base import BlogPlatform, Article, PostInfo
+from urllib.parse import urljoin
+
+from lxml import etree
+from lxml import html as lxml_html
+
+from .base import (
+    BlogPlatform, Article, PostInfo,
+    _first, _has_class, _json_loads, _parse_html, _parse_iso_datetime, _prepare_indicators, _url_path,
+)
+from .sitemap import fetch_sitemap
+
+_DETECT_INDICATORS = _prepare_indicators([
+    "/wp-content/",
+    "/wp-includes/",
+    "wp-json",
+    'generator" content="wordpress',
+    "wordpress.org",
+    "wp-block-",
+    "wp-embed",
+])
+
+
+# Concurrent REST API page requests once the page count is known
+REST_API_MAX_CONCURRENT = 8
+
+# Shared by every feed parse; recovers from the malformed XML some
+# blogs serve, and never fetches external entities
+_XML_PARSER = etree.XMLParser(recover=True, huge_tree=True, resolve_entities=False, no_network=True)
+_FEED_LINK_XPATH = etree.XPath(".//item/link[1]/text()")
+
+# Post page lookups, compiled once rather than per article. Lists are tried
+# in order and the first match wins
+
+# Content selectors in order of preference
+_CONTENT_XPATHS = tuple(etree.XPath(x) for x in (
+    f"//article//*[{_has_class('entry-content')}]",
+    f"//div[{_has_class('entry-content')}]",
+    f"//div[{_has_class('post-content')}]",
+    f"//article//*[{_has_class('post-body')}]",
+    f"//div[{_has_class('single-content')}]",
+    f"//*[{_has_class('content-area')}]//article",
+    "//article",
+))
+
+_TITLE_XPATHS = tuple(etree.XPath(x) for x in (
+    f"//h1[{_has_class('entry-title')}]",
+    f"//h1[{_has_class('post-title')}]",
+    "//article//h1",
+    f"//*[{_has_class('post-title')}]",
+    "//h1",
+))
+_OG_TITLE_XPATH = etree.XPath("//meta[@property='og:title']")
+_TITLE_TAG_XPATH = etree.XPath("//title")
+# Site name suffixes stripped from a <title> fallback
+_TITLE_SEPARATORS = (" | ", " - ", " :: ")
+
+# Common membership plugin classes, matched case-insensitively anywhere in
+# a class attribute
+_PAYWALL_CLASSES = (
+    "members-only",
+    "protected-content",
+    "paywall",
+    "subscriber-only",
+    "premium-content",
+    "restricted-content",
+)
+_CLASS_ATTRS_XPATH = etree.XPath("//@class", smart_strings=False)
+# Login prompts in the content area
+_PAYWALL_INDICATORS = (
+    "log in to view",
+    "members only",
+    "subscribe to read",
+    "premium members",
+    "login to continue",
+)
+_JSON_LD_XPATH = etree.XPath("//script[@type='application/ld+json']")
+_JSON_LD_TYPES = ("Article", "NewsArticle", "BlogPosting", "WebPage")
+# The same names as they appear quoted in raw JSON
+_JSON_LD_ARTICLE_TYPES = tuple(f'"{json_ld_type}"' for json_ld_type in _JSON_LD_TYPES)
+
+_AUTHOR_META_XPATH = etree.XPath("//meta[@name='author']")
+_AUTHOR_XPATHS = tuple(etree.XPath(x) for x in (
+    f"//*[{_has_class('author-name')}]",
+    f"//*[{_has_class('entry-author-name')}]",
+    f"//*[{_has_class('post-author-name')}]",
+    "//a[@rel='author']",
+    f"//*[{_has_class('byline')}]//a",
+    f"//*[{_has_class('author')}]//a",
+))
+
+_TIME_XPATH = etree.XPath("//time[@datetime]/@datetime")
+_PUBLISHED_META_XPATH = etree.XPath("//meta[@property='article:published_time']")
+
+# Elements stripped from the content, found in one walk with set lookups
+_UNWANTED_TAGS = frozenset({"script", "style", "nav", "header", "footer", "form"})
+_UNWANTED_CLASSES = frozenset({
+    "sidebar", "widget", "ad", "advertisement",
+    "share-buttons", "social-share", "related-posts",
+    "comments", "comment-form", "author-bio",
+    "post-navigation", "pagination", "breadcrumbs",
+})
+# Data and blob URLs, and tracking pixels or spacers, aren't worth downloading
+_SKIPPED_URL_PREFIXES = ("data:", "blob:")
+_SKIPPED_IMAGE_TOKENS = ("tracking", "pixel", "1x1", "spacer")
+# Each <img>'s first non-empty src, data-src or data-lazy-src, plus its
+# srcset, as attribute values in document order
+_IMG_ATTRS_XPATH = etree.XPath(
+    "//img/@src[. != '']"
+    " | //img[not(@src != '')]/@data-src[. != '']"
+    " | //img[not(@src != '') and not(@data-src != '')]/@data-lazy-src[. != '']"
+    " | //img/@srcset[. != '']"
+)
 
 
 class WordPressPlatform(BlogPlatform):
@@ -17,39 +125,13 @@ class WordPressPlatform(BlogPlatform):
 
     # URLs containing these keywords are not posts
     FILTER_KEYWORDS = ["wp-admin", "wp-login", "wp-content", "attachment", "page", "author", "category", "tag"]
-
-    # Content selectors in order of preference
-    CONTENT_SELECTORS = [
-        "article .entry-content",
-        "div.entry-content",
-        "div.post-content",
-        "article .post-body",
-        "div.single-content",
-        ".content-area article",
-        "article",
-    ]
-
-    TITLE_SELECTORS = [
-        "h1.entry-title",
-        "h1.post-title",
-        "article h1",
-        ".post-title",
-        "h1",
-    ]
+    # One scan per URL instead of one substring search per keyword
+    _FILTER_RE = re.compile("|".join(map(re.escape, FILTER_KEYWORDS)))
 
     def detect(self, html: str) -> bool:
         """Detect WordPress blogs by checking for WordPress-specific indicators."""
         html_lower = html.lower()
-        indicators = [
-            "/wp-content/",
-            "/wp-includes/",
-            "wp-json",
-            'generator" content="wordpress',
-            "wordpress.org",
-            "wp-block-",
-            "wp-embed",
-        ]
-        return any(indicator in html_lower for indicator in indicators)
+        return any(indicator in html_lower for indicator in _DETECT_INDICATORS)
 
     async def get_post_urls(self, base_url: str, client) -> list[PostInfo]:
         """Fetch post URLs from WordPress REST API, fallback to sitemap/feed."""
@@ -69,53 +151,67 @@ class WordPressPlatform(BlogPlatform):
 
     async def _fetch_from_rest_api(self, base_url: str, client) -> list[PostInfo]:
         """Fetch all posts via WordPress REST API with pagination."""
-        posts = []
-        page = 1
         per_page = 100  # Max allowed by WordPress
 
-        while True:
-            api_url = urljoin(base_url, f"wp-json/wp/v2/posts?per_page={per_page}&page={page}&_fields=link,slug,modified")
-            try:
-                response = await client.get(api_url)
+        def page_url(page: int) -> str:
+            return urljoin(base_url, f"wp-json/wp/v2/posts?per_page={per_page}&page={page}&_fields=link,slug,modified")
 
-                # 400 = invalid page (past end), 404 = API not available
-                if response.status_code in (400, 404):
-                    break
-                if not response.is_success:
-                    return []  # API not available, use fallback
+        try:
+            response = await client.get(page_url(1))
+            if not response.is_success:
+                return []  # API not available, use fallback
+            posts = self._rest_api_posts(response.json())
+            total_pages = int(response.headers.get("X-WP-TotalPages", 1))
+        except Exception:
+            return []
 
-                data = response.json()
-                if not data:
-                    break
+        if not posts or total_pages <= 1:
+            return posts
 
-                for post in data:
-                    modified = None
-                    if post.get("modified"):
-                        try:
-                            modified = datetime.fromisoformat(
-                                post["modified"].replace("Z", "+00:00")
-                            )
-                        except ValueError:
-                            pass
+        # The first page says how many there are, so fetch the rest at once
+        # (bounded, so a big blog isn't hit with dozens of requests together)
+        semaphore = asyncio.Semaphore(REST_API_MAX_CONCURRENT)
 
-                    posts.append(PostInfo(
-                        url=post["link"],
-                        slug=post["slug"],
-                        last_modified=modified,
-                    ))
+        async def fetch_page(page: int):
+            async with semaphore:
+                return await client.get(page_url(page))
 
-                # Check for more pages via header
-                total_pages = int(response.headers.get("X-WP-TotalPages", 1))
-                if page >= total_pages:
+        responses = await asyncio.gather(
+            *(fetch_page(page) for page in range(2, total_pages + 1)),
+            return_exceptions=True,
+        )
+        # Keep pages in order and stop at the first gap, as walking them would
+        for response in responses:
+            try:
+                if isinstance(response, Exception) or not response.is_success:
                     break
-                page += 1
-
+                page_posts = self._rest_api_posts(response.json())
             except Exception:
-                # API failed, return what we have or empty
-                return posts if posts else []
+                break
+            if not page_posts:
+                break
+            posts.extend(page_posts)
 
         return posts
 
+    def _rest_api_posts(self, data: list[dict]) -> list[PostInfo]:
+        """Build posts from one page of REST API results."""
+        posts = []
+        for post in data:
+            modified = None
+            if post.get("modified"):
+                try:
+                    modified = _parse_iso_datetime(post["modified"])
+                except ValueError:
+                    pass
+
+            posts.append(PostInfo(
+                url=post["link"],
+                slug=post["slug"],
+                last_modified=modified,
+            ))
+        return posts
+
     async def _fetch_from_sitemap(self, base_url: str, client) -> list[PostInfo]:
         """Fetch URLs from sitemap.xml."""
         sitemap_urls = [
@@ -126,30 +222,28 @@ class WordPressPlatform(BlogPlatform):
 
         for sitemap_url in sitemap_urls:
             try:
-                response = await client.get(sitemap_url)
-                if not response.is_success:
+                sitemap = await fetch_sitemap(client, sitemap_url)
+                if sitemap is None:
                     continue
-
-                root = ET.fromstring(response.content)
+                sitemap_refs, entries = sitemap
                 posts = []
 
-                ns = {"sm": "http://www.sitemaps.org/schemas/sitemap/0.9"}
-
                 # Check if this is a sitemap index
-                sitemap_refs = root.findall(".//sm:sitemap/sm:loc", ns)
                 if sitemap_refs:
                     # It's a sitemap index - look for post sitemap
-                    for ref in sitemap_refs:
-                        if ref.text and "post" in ref.text.lower():
-                            sub_response = await client.get(ref.text)
-                            if sub_response.is_success:
-                                sub_root = ET.fromstring(sub_response.content)
-                                posts.extend(self._parse_sitemap_urls(sub_root, ns))
+                    # Fetch every post sitemap at once; a failed one is just skipped
+                    sub_sitemaps = await asyncio.gather(
+                        *(fetch_sitemap(client, ref) for ref in sitemap_refs if "post" in ref.lower()),
+                        return_exceptions=True,
+                    )
+                    for sub_sitemap in sub_sitemaps:
+                        if isinstance(sub_sitemap, tuple):
+                            posts.extend(self._parse_sitemap_urls(sub_sitemap[1]))
                     if posts:
                         return posts
 
                 # Regular sitemap
-                posts = self._parse_sitemap_urls(root, ns)
+                posts = self._parse_sitemap_urls(entries)
                 if posts:
                     return posts
 
@@ -158,27 +252,20 @@ class WordPressPlatform(BlogPlatform):
 
         return []
 
-    def _parse_sitemap_urls(self, root, ns: dict) -> list[PostInfo]:
-        """Parse URLs from a sitemap XML element."""
+    def _parse_sitemap_urls(self, entries: list[tuple[str, str | None]]) -> list[PostInfo]:
+        """Build posts from sitemap (loc, lastmod) entries."""
         posts = []
-        for url_elem in root.findall(".//sm:url", ns):
-            loc = url_elem.find("sm:loc", ns)
-            lastmod = url_elem.find("sm:lastmod", ns)
+        for url, lastmod in entries:
+            slug = self._url_to_slug(url)
 
-            if loc is not None and loc.text:
-                url = loc.text.strip()
-                slug = self._url_to_slug(url)
+            modified = None
+            if lastmod:
+                try:
+                    modified = _parse_iso_datetime(lastmod.strip())
+                except ValueError:
+                    pass
 
-                modified = None
-                if lastmod is not None and lastmod.text:
-                    try:
-                        modified = datetime.fromisoformat(
-                            lastmod.text.strip().replace("Z", "+00:00")
-                        )
-                    except ValueError:
-                        pass
-
-                posts.append(PostInfo(url=url, slug=slug, last_modified=modified))
+            posts.append(PostInfo(url=url, slug=slug, last_modified=modified))
 
         return posts
 
@@ -196,15 +283,13 @@ class WordPressPlatform(BlogPlatform):
                 if not response.is_success:
                     continue
 
-                root = ET.fromstring(response.content)
+                root = etree.fromstring(response.content, _XML_PARSER)
                 posts = []
 
-                for item in root.findall(".//item"):
-                    link = item.find("link")
-                    if link is not None and link.text:
-                        url = link.text.strip()
-                        slug = self._url_to_slug(url)
-                        posts.append(PostInfo(url=url, slug=slug))
+                for link in _FEED_LINK_XPATH(root):
+                    url = link.strip()
+                    if url:
+                        posts.append(PostInfo(url=url, slug=self._url_to_slug(url)))
 
                 if posts:
                     return posts
@@ -218,25 +303,20 @@ class WordPressPlatform(BlogPlatform):
         """Filter out non-post URLs."""
         filtered = []
         for post in posts:
-            url_lower = post.url.lower()
             # Skip if URL contains filter keywords
-            if any(kw in url_lower for kw in self.FILTER_KEYWORDS):
+            if self._FILTER_RE.search(post.url.lower()):
                 continue
             # Skip if it's just the homepage
-            parsed = urlparse(post.url)
-            if not parsed.path or parsed.path == "/":
+            if not _url_path(post.url):
                 continue
             filtered.append(post)
         return filtered
 
     def _url_to_slug(self, url: str) -> str:
         """Extract slug from URL."""
-        parsed = urlparse(url)
-        path = parsed.path.strip("/")
         # WordPress URLs can be /year/month/day/slug or just /slug
         # Take the last path segment as the slug
-        parts = path.split("/")
-        slug = parts[-1] if parts else "index"
+        slug = _url_path(url).rpartition("/")[2]
         # Remove .html extension if present (Wait But Why uses .html URLs)
         if slug.endswith(".html"):
             slug = slug[:-5]
@@ -244,29 +324,29 @@ class WordPressPlatform(BlogPlatform):
 
     def extract_article(self, html: str, url: str) -> Article | None:
         """Extract article content from WordPress post HTML."""
-        soup = BeautifulSoup(html, "lxml")
+        tree = _parse_html(html)
 
         # Check for paywall
-        if self._is_paywalled(soup):
+        if self._is_paywalled(tree):
             return None
 
         # Extract metadata from JSON-LD first (most reliable)
-        metadata = self._extract_json_ld(soup)
+        metadata = self._extract_json_ld(tree)
 
         # Extract title
-        title = metadata.get("title") or self._extract_title(soup)
+        title = metadata.get("title") or self._extract_title(tree)
 
         # Extract author
-        author = metadata.get("author") or self._extract_author(soup)
+        author = metadata.get("author") or self._extract_author(tree)
 
         # Extract date
-        date = metadata.get("date") or self._extract_date(soup)
+        date = metadata.get("date") or self._extract_date(tree)
 
         # Extract main content
-        content_html = self._extract_content(soup)
+        content_html = self._extract_content(tree)
 
         # Extract image URLs
-        image_urls = self._extract_images(soup, url)
+        image_urls = self._extract_images(tree, url)
 
         slug = self._url_to_slug(url)
 
@@ -280,63 +360,53 @@ class WordPressPlatform(BlogPlatform):
             image_urls=image_urls,
         )
 
-    def _is_paywalled(self, soup: BeautifulSoup) -> bool:
+    def _is_paywalled(self, tree) -> bool:
         """Check if the post is behind a paywall."""
-        # Check for common membership plugin classes
-        paywall_classes = [
-            "members-only",
-            "protected-content",
-            "paywall",
-            "subscriber-only",
-            "premium-content",
-            "restricted-content",
-        ]
-        for cls in paywall_classes:
-            if soup.find(class_=re.compile(cls, re.IGNORECASE)):
-                return True
+        # Check for common membership plugin classes, scanning all class
+        # attributes joined together rather than testing each element
+        classes = " ".join(_CLASS_ATTRS_XPATH(tree)).lower()
+        if any(cls in classes for cls in _PAYWALL_CLASSES):
+            return True
 
         # Check for login prompts in content area
-        for selector in self.CONTENT_SELECTORS[:3]:  # Check main content selectors
-            content = soup.select_one(selector)
+        for xpath in _CONTENT_XPATHS[:3]:  # Check main content selectors
+            content = xpath(tree)
             if content:
-                text = content.get_text().lower()
-                paywall_indicators = [
-                    "log in to view",
-                    "members only",
-                    "subscribe to read",
-                    "premium members",
-                    "login to continue",
-                ]
-                if any(indicator in text for indicator in paywall_indicators):
+                text = content[0].text_content().lower()
+                if any(indicator in text for indicator in _PAYWALL_INDICATORS):
                     return True
                 break
 
         return False
 
-    def _extract_json_ld(self, soup: BeautifulSoup) -> dict:
+    def _extract_json_ld(self, tree) -> dict:
         """Extract metadata from JSON-LD script tag."""
-        import json
-
         result = {"title": None, "author": None, "date": None}
 
-        for script_tag in soup.find_all("script", {"type": "application/ld+json"}):
-            if not script_tag.string:
+        for script_tag in _JSON_LD_XPATH(tree):
+            raw = script_tag.text
+            if not raw:
+                continue
+            # Skip blocks that name only other types (BreadcrumbList,
+            # Organization, ...) without decoding them
+            if '"@type"' in raw and not any(article_type in raw for article_type in _JSON_LD_ARTICLE_TYPES):
                 continue
 
             try:
-                data = json.loads(script_tag.string)
+                data = _json_loads(raw)
 
                 # Handle array of JSON-LD objects
                 if isinstance(data, list):
                     for item in data:
-                        if item.get("@type") in ["Article", "NewsArticle", "BlogPosting", "WebPage"]:
+                        if item.get("@type") in _JSON_LD_TYPES:
                             data = item
                             break
                     else:
                         continue
 
                 # Skip if not an article type
-                if data.get("@type") not in ["Article", "NewsArticle", "BlogPosting", "WebPage", None]:
+                json_ld_type = data.get("@type")
+                if json_ld_type is not None and json_ld_type not in _JSON_LD_TYPES:
                     continue
 
                 # Extract title
@@ -358,9 +428,7 @@ class WordPressPlatform(BlogPlatform):
                     date_str = data.get("datePublished") or data.get("dateCreated")
                     if date_str:
                         try:
-                            result["date"] = datetime.fromisoformat(
-                                date_str.replace("Z", "+00:00")
-                            )
+                            result["date"] = _parse_iso_datetime(date_str)
                         except ValueError:
                             pass
 
@@ -369,24 +437,23 @@ class WordPressPlatform(BlogPlatform):
 
         return result
 
-    def _extract_title(self, soup: BeautifulSoup) -> str:
+    def _extract_title(self, tree) -> str:
         """Extract article title from HTML."""
-        for selector in self.TITLE_SELECTORS:
-            elem = soup.select_one(selector)
-            if elem:
-                return elem.get_text(strip=True)
+        elem = _first(_TITLE_XPATHS, tree)
+        if elem is not None:
+            return elem.text_content().strip()
 
         # Fallback to og:title
-        og_title = soup.find("meta", property="og:title")
-        if og_title and og_title.get("content"):
-            return og_title.get("content")
+        og_title = _OG_TITLE_XPATH(tree)
+        if og_title and og_title[0].get("content"):
+            return og_title[0].get("content")
 
         # Fallback to page title
-        title_tag = soup.find("title")
+        title_tag = _TITLE_TAG_XPATH(tree)
         if title_tag:
-            title = title_tag.get_text(strip=True)
+            title = title_tag[0].text_content().strip()
             # Remove site name (usually after | or -)
-            for sep in [" | ", " - ", " :: "]:
+            for sep in _TITLE_SEPARATORS:
                 if sep in title:
                     title = title.split(sep)[0].strip()
                     break
@@ -394,105 +461,86 @@ class WordPressPlatform(BlogPlatform):
 
         return "Untitled"
 
-    def _extract_author(self, soup: BeautifulSoup) -> str:
+    def _extract_author(self, tree) -> str:
         """Extract article author."""
         # Try meta tag
-        author_meta = soup.find("meta", {"name": "author"})
-        if author_meta and author_meta.get("content"):
-            return author_meta.get("content")
+        author_meta = _AUTHOR_META_XPATH(tree)
+        if author_meta and author_meta[0].get("content"):
+            return author_meta[0].get("content")
 
         # Try common author selectors
-        author_selectors = [
-            ".author-name",
-            ".entry-author-name",
-            ".post-author-name",
-            'a[rel="author"]',
-            ".byline a",
-            ".author a",
-        ]
-        for selector in author_selectors:
-            elem = soup.select_one(selector)
-            if elem:
-                return elem.get_text(strip=True)
+        elem = _first(_AUTHOR_XPATHS, tree)
+        if elem is not None:
+            return elem.text_content().strip()
 
         return "Unknown"
 
-    def _extract_date(self, soup: BeautifulSoup) -> datetime | None:
+    def _extract_date(self, tree) -> datetime | None:
         """Extract publication date."""
         # Try time element with datetime attribute
-        time_elem = soup.find("time", datetime=True)
-        if time_elem:
+        time_datetime = _TIME_XPATH(tree)
+        if time_datetime:
             try:
-                return datetime.fromisoformat(
-                    time_elem["datetime"].replace("Z", "+00:00")
-                )
+                return _parse_iso_datetime(time_datetime[0])
             except ValueError:
                 pass
 
         # Try meta tag
-        date_meta = soup.find("meta", property="article:published_time")
-        if date_meta and date_meta.get("content"):
+        date_meta = _PUBLISHED_META_XPATH(tree)
+        if date_meta and date_meta[0].get("content"):
             try:
-                return datetime.fromisoformat(
-                    date_meta["content"].replace("Z", "+00:00")
-                )
+                return _parse_iso_datetime(date_meta[0].get("content"))
             except ValueError:
                 pass
 
         return None
 
-    def _extract_content(self, soup: BeautifulSoup) -> str:
+    def _extract_content(self, tree) -> str:
         """Extract main article content HTML."""
-        content_elem = None
-
-        for selector in self.CONTENT_SELECTORS:
-            content_elem = soup.select_one(selector)
-            if content_elem:
-                break
+        content_elem = _first(_CONTENT_XPATHS, tree)
 
-        if not content_elem:
+        if content_elem is None:
             return "<p>Content could not be extracted.</p>"
 
-        # Remove unwanted elements
-        unwanted_selectors = [
-            "script", "style", "nav", "header", "footer",
-            ".sidebar", ".widget", ".ad", ".advertisement",
-            ".share-buttons", ".social-share", ".related-posts",
-            ".comments", ".comment-form", ".author-bio",
-            ".post-navigation", ".pagination", ".breadcrumbs",
-            "form", "iframe[src*='ad']",
+        # Remove unwanted elements (drop_tree keeps the text that follows them).
+        # Collect first: the tree can't be changed while it is being iterated
+        unwanted = [
+            el for el in content_elem.iterdescendants(etree.Element)
+            if el.tag in _UNWANTED_TAGS
+            or not _UNWANTED_CLASSES.isdisjoint((el.get("class") or "").split())
+            or (el.tag == "iframe" and "ad" in (el.get("src") or ""))
         ]
-        for unwanted in content_elem.select(", ".join(unwanted_selectors)):
-            unwanted.decompose()
+        for el in unwanted:
+            el.drop_tree()
 
-        return str(content_elem)
+        return lxml_html.tostring(content_elem, encoding="unicode", method="html", with_tail=False)
 
-    def _extract_images(self, soup: BeautifulSoup, base_url: str) -> list[str]:
+    def _extract_images(self, tree, base_url: str) -> list[str]:
         """Extract all image URLs from the article."""
         images = []
-        for img in soup.find_all("img"):
-            # Try multiple src attributes
-            src = img.get("src") or img.get("data-src") or img.get("data-lazy-src")
-            if src:
-                # Skip data URLs and tracking pixels
-                if src.startswith(("data:", "blob:")):
-                    continue
-                if any(x in src.lower() for x in ["tracking", "pixel", "1x1", "spacer"]):
-                    continue
-                # Make absolute URL
-                absolute_url = urljoin(base_url, src)
-                images.append(absolute_url)
-
-            # Also check srcset for high-res images
-            srcset = img.get("srcset")
-            if srcset:
-                # Take the largest image from srcset
-                parts = srcset.split(",")
+        seen = set()  # Everything in images, for O(1) srcset membership checks
+        for value in _IMG_ATTRS_XPATH(tree):
+            if value.attrname == "srcset":
+                # Also check srcset for high-res images
+                parts = value.split(",")
                 for part in parts:
                     part = part.strip().split()[0]
                     if part and not part.startswith("data:"):
                         absolute_url = urljoin(base_url, part)
-                        if absolute_url not in images:
+                        if absolute_url not in seen:
+                            seen.add(absolute_url)
                             images.append(absolute_url)
+                continue
+
+            # Skip data URLs and tracking pixels
+            if value.startswith(_SKIPPED_URL_PREFIXES):
+                continue
+            value_lower = value.lower()
+            if any(token in value_lower for token in _SKIPPED_IMAGE_TOKENS):
+                continue
+            # Make absolute URL
+            absolute_url = urljoin(base_url, value)
+            seen.add(absolute_url)
+            images.append(absolute_url)
 
         return images
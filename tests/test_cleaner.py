@@ -0,0 +1,10 @@
+from blogpack.cleaner import clean_html
+
+
+def test_comment_only_content_is_empty():
+    assert clean_html("<!-- c -->") == ""
+    assert clean_html(" <!-- a --> <!-- b --> ") == ""
+
+
+def test_keeps_content_and_strips_scripts():
+    assert clean_html('<p class="x">Hi<script>alert(1)</script></p>') == "<p>Hi</p>"